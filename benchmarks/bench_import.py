@@ -0,0 +1,82 @@
+"""Benchmark the import cost of the integration during Home Assistant startup.
+
+Every module is imported in a fresh interpreter after the Home Assistant
+modules the platform needs anyway, so only the integration's own cost
+(and the third-party packages it pulls in) is measured:
+
+- device_tracker: what Home Assistant imports at startup
+- backends.<flavor>: imported on first use for the detected firmware flavor
+- bs4: BeautifulSoup alone, needed by the PC UI backend only
+
+    python -m benchmarks.bench_import --runs 10
+
+Requires Home Assistant in the environment, like the integration itself.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.iptime_tracker"
+PRELOAD = (
+    "homeassistant.components.device_tracker",
+    "homeassistant.components.sensor",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.discovery",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+)
+TARGETS = {
+    "device_tracker": (f"{PACKAGE}.device_tracker",),
+    "backends.pc": (f"{PACKAGE}.device_tracker", f"{PACKAGE}.backends.pc"),
+    "backends.mobile": (f"{PACKAGE}.device_tracker", f"{PACKAGE}.backends.mobile"),
+    "backends.beta_ui": (f"{PACKAGE}.device_tracker", f"{PACKAGE}.backends.beta_ui"),
+    "backends.mesh": (f"{PACKAGE}.device_tracker", f"{PACKAGE}.backends.mesh"),
+    "bs4": ("bs4",),
+}
+
+_SCRIPT = """
+import importlib, sys, time
+for name in {preload!r}:
+    importlib.import_module(name)
+for name in {modules!r}[:-1]:
+    importlib.import_module(name)
+before = set(sys.modules)
+start = time.perf_counter()
+importlib.import_module({modules!r}[-1])
+print(time.perf_counter() - start, len(set(sys.modules) - before))
+"""
+
+
+def measure(modules, runs):
+    """Return (median seconds, new modules) of importing the last module."""
+    times = []
+    count = 0
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _SCRIPT.format(preload=PRELOAD, modules=modules)],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+        count = int(output[1])
+    return statistics.median(times), count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'module':<20} {'import ms':>10} {'modules':>8}")
+    for name, modules in TARGETS.items():
+        seconds, count = measure(modules, args.runs)
+        print(f"{name:<20} {seconds * 1000:>10.2f} {count:>8}")
+
+
+if __name__ == "__main__":
+    main()
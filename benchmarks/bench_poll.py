@@ -0,0 +1,172 @@
+"""Benchmark one router poll against the local fake ipTIME router.
+
+For every firmware flavor and station count this reports:
+
+- poll latency (median / p95, ms)
+- CPU time per poll in the tracker process (ms, the router runs in a child process)
+- memory allocated per poll (KiB, tracemalloc peak)
+- throughput (polls per second, one router)
+- the longest event loop stall seen during the polls (ms)
+
+and the cost of the station parsers (parse_pcinfo_status, parse_mobile_stations,
+parse_beta_stations) and of the JSON decode layer on the same payloads.
+--parse-mode selects where the tracker parses responses (loop, thread, process).
+
+    python -m benchmarks.bench_poll --flavor all --stations 10,100,1000 --parse-mode thread
+
+Requires Home Assistant in the environment, like the integration itself.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fake_router import FLAVORS, FakeRouter  # noqa: E402
+from custom_components.iptime_tracker.backends.beta_ui import parse_beta_stations  # noqa: E402
+from custom_components.iptime_tracker.backends.mobile import parse_mobile_stations  # noqa: E402
+from custom_components.iptime_tracker.backends.pc import parse_pcinfo_status  # noqa: E402
+from custom_components.iptime_tracker.const import PARSE_MODE_LOOP  # noqa: E402
+from custom_components.iptime_tracker.decode import loads  # noqa: E402
+from custom_components.iptime_tracker.device_tracker import IPTimeAPI  # noqa: E402
+from custom_components.iptime_tracker.metrics import LoopLagMonitor  # noqa: E402
+from custom_components.iptime_tracker.station import Station  # noqa: E402
+from custom_components.iptime_tracker.worker import IPTimeParseWorker  # noqa: E402
+
+
+def _serve(flavor, stations, latency, mesh, queue):
+    async def main():
+        router = FakeRouter(flavor, stations, latency, mesh)
+        queue.put(await router.start())
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+class RouterProcess:
+    """Run the fake router in a child process so its CPU time is not measured."""
+
+    def __init__(self, flavor, stations, latency=0.0, mesh=False):
+        self._queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(flavor, stations, latency, mesh, self._queue), daemon=True
+        )
+
+    def __enter__(self):
+        self._process.start()
+        return self._queue.get(timeout=10)
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.join()
+
+
+async def bench_poll(url, polls, parse_mode=PARSE_MODE_LOOP):
+    worker = IPTimeParseWorker(parse_mode)
+    api = IPTimeAPI(None, url, "admin", "admin", worker=worker)
+    if not await api.async_update():
+        raise RuntimeError(f"Login to {url} failed")
+
+    # warm up the keep-alive pool
+    for _ in range(3):
+        await api.async_update()
+
+    monitor = LoopLagMonitor(asyncio.get_running_loop(), 0.001)
+    monitor.start()
+    latencies = []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(polls):
+        start = time.perf_counter()
+        await api.async_update()
+        latencies.append(time.perf_counter() - start)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    monitor.stop()
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    for _ in range(max(1, polls // 10)):
+        await api.async_update()
+        _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stations = sum(1 for value in api.result.values() if isinstance(value, Station))
+    await api.async_close()
+    worker.shutdown()
+    latencies.sort()
+    return {
+        "stations": stations,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "cpu": cpu / polls * 1000,
+        "alloc": peak / 1024,
+        "throughput": polls / wall,
+        "lag": monitor.lag_max * 1000,
+    }
+
+
+def bench_parsers(count, rounds=20):
+    """Time the parsers on payloads generated by the fake router."""
+    router = FakeRouter("pc", count)
+    request = {"cookies": {"efm_session_id": "A1B2C3D4E5F6A7B8"}, "body": b""}
+    pc_text = router._pc_wlan(request, "5GHz")[2].decode()
+    mobile_body = router._m_wlan(request, "5GHz")[2]
+    mobile_json = json.loads(mobile_body)["stalist"]
+    router.mesh = True
+    mesh_body = router._mesh_station(request)[2]
+    beta_json = json.loads(router._beta_service(dict(request, body=b'{"method": "network/interface/lan/stations"}'))[2])
+
+    results = {}
+    for name, func in (
+        ("parse_pcinfo_status", lambda: parse_pcinfo_status(pc_text, "5GHz")),
+        ("parse_mobile_stations", lambda: parse_mobile_stations(mobile_json, "5GHz")),
+        ("parse_beta_stations", lambda: parse_beta_stations(beta_json["result"])),
+        ("decode_stalist", lambda: loads(mobile_body)["stalist"]),
+        ("decode_mesh_station", lambda: loads(mesh_body)["station"]),
+    ):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            func()
+        results[name] = (time.perf_counter() - start) / rounds * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flavor", choices=FLAVORS + ("all",), default="all")
+    parser.add_argument("--stations", default="10,100,1000")
+    parser.add_argument("--latency", type=float, default=0.0, help="router latency per request (ms)")
+    parser.add_argument("--polls", type=int, default=50)
+    parser.add_argument("--mesh", action="store_true")
+    parser.add_argument("--parse-mode", choices=("loop", "thread", "process"), default=PARSE_MODE_LOOP)
+    args = parser.parse_args()
+
+    flavors = FLAVORS if args.flavor == "all" else (args.flavor,)
+    counts = [int(count) for count in args.stations.split(",")]
+
+    print(f"{'flavor':<8} {'stations':>8} {'p50 ms':>8} {'p95 ms':>8} {'cpu ms':>8} {'alloc KiB':>10} {'polls/s':>8} {'lag ms':>8}")
+    for flavor in flavors:
+        for count in counts:
+            with RouterProcess(flavor, count, args.latency / 1000, args.mesh) as url:
+                result = asyncio.run(bench_poll(url, args.polls, args.parse_mode))
+            print(
+                f"{flavor:<8} {result['stations']:>8} {result['p50']:>8.2f} {result['p95']:>8.2f} "
+                f"{result['cpu']:>8.2f} {result['alloc']:>10.1f} {result['throughput']:>8.1f} {result['lag']:>8.2f}"
+            )
+
+    print()
+    print(f"{'parser (ms per call)':<24} " + " ".join(f"{count:>8}" for count in counts))
+    parsed = {count: bench_parsers(count) for count in counts}
+    for name in ("parse_pcinfo_status", "parse_mobile_stations", "parse_beta_stations", "decode_stalist", "decode_mesh_station"):
+        print(f"{name:<24} " + " ".join(f"{parsed[count][name]:>8.3f}" for count in counts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""Local stand-in for an ipTIME router.
+
+Emulates the endpoints the tracker talks to for every firmware flavor:
+
+- ``pc``: HTML login (LOGIN_URN), HOSTINFO_URN without the mobile package,
+  the macauth_pcinfo_status tables (WLAN_2G_URN, WLAN_5G_URN) and MESH_URN.
+- ``mobile``: HOSTINFO_URN with the mobile package, M_LOGIN_URN and the
+  JSON station lists (M_WLAN_2G_URN, M_WLAN_5G_URN, M_MESH_URN).
+- ``beta_ui``: /ui/flutter_bootstrap.js and the JSON-RPC BETA_SERVICE_URN.
+
+With ``mesh`` enabled, MESH_STATION_URN returns an EasyMesh topology and
+part of the stations are moved to satellite agents. With ``batch`` disabled
+the JSON-RPC service rejects batch requests like older Beta UI firmware.
+
+Run standalone with ``python -m benchmarks.fake_router --flavor pc``.
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+from urllib.parse import parse_qs
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.iptime_tracker.const import (  # noqa: E402
+    HOSTINFO_URN,
+    LOGIN_URN,
+    LOGOUT_URN,
+    WLAN_2G_URN,
+    WLAN_5G_URN,
+    MESH_URN,
+    M_LOGIN_URN,
+    M_LOGOUT_URN,
+    M_WLAN_2G_URN,
+    M_WLAN_5G_URN,
+    M_MESH_URN,
+    MESH_STATION_URN,
+    BETA_UI_URN,
+    BETA_SERVICE_URN,
+)
+
+FLAVORS = ("pc", "mobile", "beta_ui")
+SESSION_ID = "A1B2C3D4E5F6A7B8"
+
+
+def make_stations(count, seed=0):
+    """Return deterministic station descriptions shared by every flavor."""
+    rng = random.Random(seed)
+    stations = []
+    for index in range(count):
+        seconds = rng.randint(0, 5 * 24 * 3600)
+        stations.append(
+            {
+                "mac": "02-00-00-%02X-%02X-%02X" % (index >> 16 & 0xFF, index >> 8 & 0xFF, index & 0xFF),
+                "ip": f"192.168.{index // 250}.{index % 250 + 2}",
+                "band": "2.4GHz" if index % 2 else "5GHz",
+                "seconds": seconds,
+                "rssi": rng.randint(-85, -40),
+                "down_speed": rng.randint(0, 866),
+                "up_speed": rng.randint(0, 866),
+                "down_bytes": rng.randint(0, 10 ** 10),
+                "up_bytes": rng.randint(0, 10 ** 9),
+            }
+        )
+    return stations
+
+
+class FakeRouter:
+    """asyncio HTTP/1.1 server answering like an ipTIME router."""
+
+    def __init__(self, flavor="pc", stations=10, latency=0.0, mesh=False, seed=0, batch=True, idle_timeout=None):
+        if flavor not in FLAVORS:
+            raise ValueError(f"Unknown flavor: {flavor}")
+        self.flavor = flavor
+        self.latency = latency
+        self.mesh = mesh
+        self.batch = batch
+        # close keep-alive connections idle for longer than this (seconds), like the router's httpd
+        self.idle_timeout = idle_timeout
+        # extra delay per (method, target), e.g. to make one band slow
+        self.delays = {}
+        self.stations = make_stations(stations, seed)
+        self.requests = 0
+        self.connections = 0
+        self._server = None
+        self._tick = 0
+        self._routes = {
+            ("GET", HOSTINFO_URN): self._hostinfo,
+            ("POST", LOGIN_URN): self._pc_login,
+            ("GET", LOGOUT_URN): self._empty,
+            ("GET", WLAN_2G_URN): lambda request: self._pc_wlan(request, "2.4GHz"),
+            ("GET", WLAN_5G_URN): lambda request: self._pc_wlan(request, "5GHz"),
+            ("GET", MESH_URN): self._pc_mesh,
+            ("POST", M_LOGIN_URN): self._m_login,
+            ("GET", M_LOGOUT_URN): self._empty,
+            ("GET", M_WLAN_2G_URN): lambda request: self._m_wlan(request, "2.4GHz"),
+            ("GET", M_WLAN_5G_URN): lambda request: self._m_wlan(request, "5GHz"),
+            ("GET", M_MESH_URN): self._m_mesh,
+            ("GET", MESH_STATION_URN): self._mesh_station,
+            ("GET", BETA_UI_URN + "flutter_bootstrap.js"): self._beta_bootstrap,
+            ("GET", BETA_UI_URN): self._beta_bootstrap,
+            ("POST", BETA_SERVICE_URN): self._beta_service,
+        }
+
+    async def start(self, host="127.0.0.1", port=0):
+        self._server = await asyncio.start_server(self._handle, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{self.port}"
+        return self.url
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    # ----------------------------------------------------------------- HTTP
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = b""
+                if headers.get("content-length"):
+                    body = await reader.readexactly(int(headers["content-length"]))
+                cookies = {}
+                for item in headers.get("cookie", "").split(";"):
+                    key, _, value = item.strip().partition("=")
+                    if key:
+                        cookies[key] = value
+
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                if (method, target) in self.delays:
+                    await asyncio.sleep(self.delays[(method, target)])
+                request = {"method": method, "target": target, "cookies": cookies, "body": body}
+                handler = self._routes.get((method, target))
+                if handler is None:
+                    status, content_type, payload, extra = 404, "text/html", b"Not Found", ""
+                else:
+                    status, content_type, payload, extra = handler(request)
+                # ipTIME처럼 일부 비정상적인 헤더를 함께 보냅니다.
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} OK\r\n"
+                        f"Content-Type: {content_type}\r\n"
+                        f"Content-Length: {len(payload)}\r\n"
+                        "Cache-Control: no-cache\r\n"
+                        "X-Frame-Options SAMEORIGIN\r\n"
+                        f"{extra}"
+                        "\r\n"
+                    ).encode("latin-1")
+                    + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _authorized(self, request):
+        return request["cookies"].get("efm_session_id") == SESSION_ID
+
+    @staticmethod
+    def _empty(request):
+        return 200, "text/html", b"", ""
+
+    # ------------------------------------------------------------------ PC
+
+    def _hostinfo(self, request):
+        if self.flavor == "mobile":
+            text = "product_name=A3004NS-M\niux=1\niux_package_installed=1\n"
+        else:
+            text = "product_name=A3004NS\n"
+        return 200, "text/plain", text.encode(), ""
+
+    def _pc_login(self, request):
+        form = parse_qs(request["body"].decode())
+        if form.get("username") and form.get("passwd"):
+            text = f"<html><script>setCookie('{SESSION_ID}'); window.location.href = '/';</script></html>"
+        else:
+            text = '<html><script>parent.parent.location = "/sess-bin/login_session.cgi?noauto=1"; //session_timeout </script></html>'
+        return 200, "text/html", text.encode(), ""
+
+    def _pc_wlan(self, request, band):
+        if not self._authorized(request):
+            text = '<html><script>parent.parent.location = "/sess-bin/login_session.cgi?noauto=1"; //session_timeout </script></html>'
+            return 200, "text/html", text.encode(), ""
+        self._tick += 1
+        rows = [
+            '<tr class="item_text"><td>MAC 주소</td><td></td><td>연결 시간</td><td>IP 주소</td><td></td></tr>'
+        ]
+        for station in self._local_stations(band):
+            days, rest = divmod(station["seconds"] + self._tick, 86400)
+            hours, rest = divmod(rest, 3600)
+            minutes, seconds = divmod(rest, 60)
+            rows.append(
+                '<tr class="item_text">'
+                f'<td class="mac">{station["mac"]}</td>'
+                '<td><input type="checkbox" name="pcinfo"></td>'
+                f"<td>{days}일 {hours}시간 {minutes}분 {seconds}초</td>"
+                f'<td class="gray_text"><span>{station["ip"]}</span></td>'
+                "</tr>"
+            )
+        text = "<html><body><table>" + "\n".join(rows) + "</table></body></html>"
+        return 200, "text/html; charset=utf-8", text.encode(), ""
+
+    def _pc_mesh(self, request):
+        checked = "" if self.mesh else " checked"
+        text = f'<html><body><input type="radio" id="mode_none" name="mode"{checked}></body></html>'
+        return 200, "text/html", text.encode(), ""
+
+    # -------------------------------------------------------------- Mobile
+
+    def _m_login(self, request):
+        text = f"<html><script>setCookie('{SESSION_ID}'); top.location = '/m_main.cgi';</script></html>"
+        return 200, "text/html", text.encode(), ""
+
+    def _m_wlan(self, request, band):
+        if not self._authorized(request):
+            return 200, "text/html", b'<html><script> top.location = "/";</script></html>', ""
+        self._tick += 1
+        stalist = []
+        for station in self._local_stations(band):
+            days, rest = divmod(station["seconds"] + self._tick, 86400)
+            hours, rest = divmod(rest, 3600)
+            minutes, seconds = divmod(rest, 60)
+            stalist.append(
+                {
+                    "mac": station["mac"],
+                    "ipaddr": station["ip"],
+                    "day": days,
+                    "hour": hours,
+                    "min": minutes,
+                    "sec": seconds,
+                }
+            )
+        stalist.append({"count": len(stalist)})
+        return 200, "application/json", json.dumps({"stalist": stalist}).encode(), ""
+
+    def _m_mesh(self, request):
+        payload = {"product_name": "A3004NS-M"}
+        if self.mesh:
+            payload["easymesh"] = {"mode": "controller"}
+        return 200, "application/json", json.dumps(payload).encode(), ""
+
+    # ---------------------------------------------------------------- Mesh
+
+    def _mesh_station(self, request):
+        if not self._authorized(request):
+            return 200, "text/html", b"<html></html>", ""
+        self._tick += 1
+        now = 1700000000 + self._tick
+        station = []
+        for index, item in enumerate(self.stations):
+            if index % 3:
+                continue
+            station.append(
+                {
+                    "mac": item["mac"].replace("-", ":"),
+                    "ip": item["ip"],
+                    "connection": "WIRELESS",
+                    "mode": "5G" if item["band"] == "5GHz" else "2.4G",
+                    "timestamp": now,
+                    "connected_ts": now - item["seconds"],
+                    "rssi": item["rssi"],
+                    "down_speed": item["down_speed"],
+                    "up_speed": item["up_speed"],
+                    "down_bytes": item["down_bytes"] + self._tick * 1000,
+                    "up_bytes": item["up_bytes"] + self._tick * 100,
+                    "agent": "agent-1",
+                }
+            )
+        payload = {
+            "agent": [
+                {"id": "agent-0", "role": "controller", "backhaul": None},
+                {"id": "agent-1", "role": "agent", "backhaul": {"parent": "agent-0", "rssi": -55}},
+            ],
+            "station": station,
+        }
+        return 200, "application/json", json.dumps(payload).encode(), ""
+
+    # ------------------------------------------------------------- Beta UI
+
+    def _beta_bootstrap(self, request):
+        if self.flavor != "beta_ui":
+            return 404, "text/html", b"Not Found", ""
+        return 200, "application/javascript", b'_flutter.loader.load({serviceUrl: "/cgi/service.cgi"});', ""
+
+    def _beta_service(self, request):
+        try:
+            call = json.loads(request["body"] or b"{}")
+        except ValueError:
+            return 200, "application/json", b'{"error": {"code": -32700}}', ""
+        extra = ""
+        if isinstance(call, list):
+            if not self.batch:
+                return 200, "application/json", b'{"result": null, "error": {"code": -32600}}', ""
+            results = [self._beta_call(item, request) for item in call]
+            payload = [result for result, _ in results]
+        else:
+            payload, extra = self._beta_call(call, request)
+        return 200, "application/json", json.dumps(payload).encode(), extra
+
+    def _beta_call(self, call, request):
+        method = call.get("method")
+        response = {"id": call.get("id")} if "id" in call else {}
+        if method == "session/login":
+            response["result"] = True
+            return response, f"Set-Cookie: efm_session_id={SESSION_ID}; Path=/\r\n"
+        if not self._authorized(request):
+            response["result"] = None
+            response["error"] = {"code": -31998, "message": "Unauthenticated"}
+            return response, ""
+        if method == "session/update":
+            response["result"] = True
+        elif method == "easymesh/info":
+            response["result"] = {"active": self.mesh}
+        elif method == "network/interface/lan/stations":
+            self._tick += 1
+            response["result"] = [self._beta_station(station) for station in self.stations]
+        else:
+            response["result"] = None
+            response["error"] = {"code": -32601, "message": "Method not found"}
+        return response, ""
+
+    def _beta_station(self, station):
+        return {
+            "mac": station["mac"].replace("-", ":"),
+            "info": {"ip": station["ip"], "name": f"host-{station['mac'][-5:]}"},
+            "connection": {
+                "type": "wireless",
+                "wireless": {
+                    "bss": "5g.1" if station["band"] == "5GHz" else "2g.1",
+                    "rssi": station["rssi"],
+                    "duration": station["seconds"] + self._tick,
+                    "down_speed": station["down_speed"],
+                    "up_speed": station["up_speed"],
+                    "down_bytes": station["down_bytes"],
+                    "up_bytes": station["up_bytes"],
+                },
+            },
+        }
+
+    def _local_stations(self, band):
+        return [station for station in self.stations if station["band"] == band]
+
+
+async def _main(args):
+    router = FakeRouter(args.flavor, args.stations, args.latency / 1000, args.mesh)
+    url = await router.start(args.host, args.port)
+    print(f"Fake ipTIME router ({args.flavor}, {args.stations} stations) on {url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await router.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--flavor", choices=FLAVORS, default="pc")
+    parser.add_argument("--stations", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="per request latency (ms)")
+    parser.add_argument("--mesh", action="store_true")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    try:
+        asyncio.run(_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,29 @@
+"""Firmware specific response parsers, imported only when a router needs them.
+
+- pc: PC UI station pages and the EasyMesh setting page (BeautifulSoup)
+- mobile: mobile UI station lists
+- beta_ui: Beta UI JSON-RPC responses
+- mesh: EasyMesh topology, used next to any flavor
+"""
+from importlib import import_module
+import sys
+
+BACKEND_PC = "pc"
+BACKEND_MOBILE = "mobile"
+BACKEND_BETA_UI = "beta_ui"
+BACKEND_MESH = "mesh"
+BACKENDS = (BACKEND_PC, BACKEND_MOBILE, BACKEND_BETA_UI, BACKEND_MESH)
+
+
+def loaded_backend(name):
+    """Return the backend module if it has been imported already, otherwise None."""
+    return sys.modules.get(f"{__name__}.{name}")
+
+
+def load_backend(name):
+    """Import a backend module.
+    Importing is blocking I/O; inside Home Assistant call this from an executor.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}")
+    return import_module(f".{name}", __name__)
@@ -0,0 +1,79 @@
+"""Beta UI (JSON-RPC service.cgi) parsers."""
+from ..const import BETA_STATIONS_METHOD
+from ..decode import loads
+from ..station import Station
+
+
+def parse_beta_stations(device_list):
+    """Parse the wireless stations of network/interface/lan/stations."""
+    result_dict = dict()
+    for device in device_list:
+        connect_type = device['connection']['type']
+        if connect_type != 'wireless':
+            continue
+
+        bss = device['connection'][connect_type]['bss']
+        if bss == '5g.1':
+            band = "5GHz"
+        elif bss == '2g.1':
+            band = "2.4GHz"
+        else:
+            band = bss
+
+        # 2026.10.18. RSSI에 따른 home / not_home 판단은 IPTimeSignalFilter에서 평활화 후 수행합니다.
+        rss = device['connection'][connect_type]['rssi']
+        # 2026.10.18. 연결 시간은 초 단위로 보관하고, 속성을 읽을 때만 문자열로 바꿉니다.
+        connection = device['connection'][connect_type]
+        result_dict[device['mac'].replace(":", "-")] = Station(
+            device['info']['ip'],
+            band,
+            connection['duration'],
+            rss,
+            connection['down_speed'],
+            connection['up_speed'],
+            connection['down_bytes'],
+            connection['up_bytes'],
+            name=device['info'].get('name'),
+            source="beta_stations",
+        )
+    return result_dict
+
+
+def _parse_result(response, method):
+    """Replace the result list of the stations method by its station table."""
+    if method == BETA_STATIONS_METHOD and isinstance(response.get("result"), list):
+        response["result"] = parse_beta_stations(response["result"])
+
+
+def parse_beta_payload(content, method):
+    """Decode the Beta UI JSON-RPC response of a single method call.
+    Raises ValueError when the body is not JSON.
+    """
+    document = loads(content)
+    if isinstance(document, dict):
+        _parse_result(document, method)
+    return document
+
+
+def parse_beta_batch(content, methods):
+    """Decode a Beta UI JSON-RPC batch response of the given methods.
+
+    Returns (responses, by_id). responses holds one response per method,
+    matched by id when every item carries the int id of a distinct request,
+    otherwise by position when the list has one item per method. It is None
+    when the reply matches neither (e.g. a single error object from firmware
+    without batch support). Raises ValueError when the body is not JSON.
+    """
+    document = loads(content)
+    if (
+        not isinstance(document, list)
+        or len(document) != len(methods)
+        or not all(isinstance(item, dict) for item in document)
+    ):
+        return None, False
+    ids = [item.get("id") for item in document]
+    by_id = all(type(index) is int for index in ids) and sorted(ids) == list(range(len(methods)))
+    responses = sorted(document, key=lambda item: item["id"]) if by_id else document
+    for method, response in zip(methods, responses):
+        _parse_result(response, method)
+    return responses, by_id
@@ -0,0 +1,75 @@
+"""EasyMesh topology parser, used next to any firmware flavor."""
+from ..decode import loads
+from ..station import Station
+
+
+def parse_mesh_stations(content, previous):
+    """Parse the station attachments of the EasyMesh topology.
+
+    Returns (result_dict, topology). topology holds the agent / backhaul
+    information of the document. previous is the result_dict of the last
+    poll: a station attached with the same IP and mode keeps its Station
+    record, and only its connected time, RSSI and traffic counters are
+    updated in place. Raises KeyError when the page cannot be read.
+    """
+    try:
+        document = loads(content)
+        device_list = document["station"]
+        topology = {key: value for key, value in document.items() if key != "station"}
+    except Exception:
+        raise KeyError()
+
+    result_dict = {}
+    result_dict["session"] = True
+    for device in device_list:
+        if (
+            "connection" in device
+            and device["connection"] != "Unknown"
+            and device["connection"] != "WIRED"
+        ):
+            if "mac" in device:
+                connected_seconds = device["timestamp"] - \
+                    device["connected_ts"]
+                mac = device["mac"].replace(":", "-")
+                rss = device.get('rssi')
+
+                if "ip" in device:
+                    ip = device["ip"]
+                else:
+                    ip = "N/A"
+
+                bss = device["mode"]
+                if bss == '5G':
+                    band = "5GHz"
+                elif bss == '2.4G':
+                    band = "2.4GHz"
+                else:
+                    band = bss
+
+                # 2026.10.18. 같은 IP / 대역으로 연결된 단말은 Station을 다시 만들지 않고 변하는 값만 갱신합니다.
+                station = previous.get(mac)
+                if isinstance(station, Station) and station.ip == ip and station.band == band:
+                    station.stay = connected_seconds
+                    station.rssi = rss
+                    station.down_speed = device.get('down_speed')
+                    station.up_speed = device.get('up_speed')
+                    station.down_bytes = device.get('down_bytes')
+                    station.up_bytes = device.get('up_bytes')
+                    station.name = device.get('name')
+                    station.state = "home"
+                    result_dict[mac] = station
+                    continue
+
+                result_dict[mac] = Station(
+                    ip,
+                    band,
+                    connected_seconds,
+                    rss,
+                    device.get('down_speed'),
+                    device.get('up_speed'),
+                    device.get('down_bytes'),
+                    device.get('up_bytes'),
+                    name=device.get('name'),
+                    source="mesh",
+                )
+    return result_dict, topology
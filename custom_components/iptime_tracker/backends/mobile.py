@@ -0,0 +1,43 @@
+"""Mobile UI (iux_get.cgi) parsers."""
+from ..decode import loads
+from ..station import Station
+
+
+def _count(value):
+    """Return a day / hour / min / sec field as int, 0 when it is blank or not a number."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_mobile_stations(stalist, band):
+    """Parse the stalist array of the mobile UI station list."""
+    result_dict = {}
+    for device in stalist:
+        if "mac" in device:
+            if device.get("ipaddr"):
+                ip = device["ipaddr"]
+            else:
+                ip = False
+            # 2026.10.18. 연결 시간 값 하나가 비어 있거나 숫자가 아니어도(예: "-") 목록 전체를 버리지 않습니다.
+            connected_seconds = (
+                _count(device.get('day')) * 86400
+                + _count(device.get('hour')) * 3600
+                + _count(device.get('min')) * 60
+                + _count(device.get('sec'))
+            )
+            result_dict[device["mac"]] = Station(ip, band, connected_seconds, source=band)
+        else:
+            result_dict["session"] = True
+    return result_dict
+
+
+def parse_mobile_page(content, band):
+    """Decode the mobile UI response and parse its stalist array.
+    Raises KeyError when the body has no stalist (e.g. a login redirect page).
+    """
+    document = loads(content)
+    if not isinstance(document, dict):
+        raise KeyError("stalist")
+    return parse_mobile_stations(document["stalist"], band)
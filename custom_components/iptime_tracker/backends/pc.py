@@ -0,0 +1,91 @@
+"""PC UI (timepro.cgi) parsers."""
+from bs4 import BeautifulSoup
+from hashlib import blake2b
+from html import unescape
+import re
+
+from ..decode import decode_text
+from ..station import Station
+
+_ROW_RE = re.compile(r"<tr(?=[\s>/])[^>]*>", re.I)
+_ROW_END_RE = re.compile(r"</tr\s*>", re.I)
+_CELL_RE = re.compile(r"<td(?=[\s>/])[^>]*>(.*?)(?=</td\s*>|<td[\s>/]|$)", re.I | re.S)
+_TAG_RE = re.compile(r"<!--.*?-->|<[^>]*>", re.S)
+_IP_RE = re.compile(r"\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}")
+# 연결 시간 셀: 숫자가 있고 IP(.), MAC(- :) 문자와 태그가 없는 셀 내용
+_STAY_RE = re.compile(rb"(?<=>)([^<>.:\-]*\d[^<>.:\-]*)(?=</td)", re.I)
+
+
+def _cell_text(raw):
+    if "<" in raw:
+        raw = _TAG_RE.sub("", raw)
+    if "&" in raw:
+        raw = unescape(raw)
+    return raw
+
+
+def parse_pcinfo_status(text, band):
+    """Parse the PC UI macauth_pcinfo_status table in a single pass.
+
+    Returns the same table as the BeautifulSoup based device_parsing:
+    rows with four cells are Station records keyed by MAC, any other row marks
+    the session as alive, and a page without rows raises KeyError. An IP cell
+    without an address gives "N/A" (device_parsing raised AttributeError).
+    """
+    rows = _ROW_RE.split(text)
+    if len(rows) == 1:
+        raise KeyError()
+
+    result_dict = {}
+    for row in rows[1:]:
+        end = _ROW_END_RE.search(row)
+        if end:
+            row = row[:end.start()]
+        cells = _CELL_RE.findall(row)
+        if len(cells) == 4:
+            # BeautifulSoup의 len(td)와 동일하게, 내용이 있으면 IP를 찾습니다.
+            # 2026.10.18. 내용이 있어도 IP가 없으면(예: "-") 빈 셀처럼 N/A로 처리합니다.
+            match = _IP_RE.search(_cell_text(cells[3])) if cells[3] else None
+            ip = match.group() if match else "N/A"
+            result_dict[_cell_text(cells[0])] = Station(ip, band, _cell_text(cells[2]), source=band)
+        else:
+            result_dict["session"] = True
+    return result_dict
+
+
+def _stations(result_dict):
+    return [station for station in result_dict.values() if isinstance(station, Station)]
+
+
+def parse_pcinfo_page(content, encoding, band, previous=None):
+    """Decode and parse one band of the PC UI station page.
+
+    Returns (result_dict, entry). entry is the (fingerprint, result_dict)
+    cache entry of the page, a hash of the body without its connection time
+    cells, or None when those cells do not line up with the stations.
+    When previous has the same fingerprint only the connection times
+    changed: the stations of previous get the new times in place and the
+    page is not parsed again.
+    """
+    fingerprint = blake2b(_STAY_RE.sub(b"", content), digest_size=16).digest()
+    stays = [_cell_text(decode_text(stay, encoding)) for stay in _STAY_RE.findall(content)]
+    if previous is not None and previous[0] == fingerprint:
+        stations = _stations(previous[1])
+        if len(stations) == len(stays):
+            for station, stay in zip(stations, stays):
+                station.stay = stay
+            return previous[1], previous
+
+    result_dict = parse_pcinfo_status(decode_text(content, encoding), band)
+    if stays != [station.stay for station in _stations(result_dict)]:
+        return result_dict, None
+    return result_dict, (fingerprint, result_dict)
+
+
+def parse_pc_mesh(content, encoding):
+    """Return True when the PC UI EasyMesh page has a MESH mode selected."""
+    soup = BeautifulSoup(decode_text(content, encoding), "html.parser")
+    mesh_mode = soup.find("input", attrs={"id": "mode_none"})
+    if not mesh_mode:
+        return False
+    return "checked" not in mesh_mode.attrs
@@ -0,0 +1,94 @@
+"""Circuit breaker for one ipTIME router."""
+import logging
+import random
+import time
+
+from .const import BREAKER_THRESHOLD, BREAKER_BACKOFF_BASE, BREAKER_BACKOFF_MAX
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class IPTimeCircuitBreaker:
+    """Stop sending requests to a router that does not answer.
+
+    closed: requests are sent; threshold consecutive unanswered requests open
+    the circuit. open: requests fail at once until the backoff delay has
+    passed. half_open: a single probe is allowed; an answer closes the
+    circuit, another failure opens it again with a doubled delay (with equal
+    jitter, between half and all of the delay).
+    """
+
+    def __init__(
+        self,
+        name,
+        threshold=BREAKER_THRESHOLD,
+        backoff_base=BREAKER_BACKOFF_BASE,
+        backoff_max=BREAKER_BACKOFF_MAX,
+    ):
+        self._name = name
+        self._threshold = threshold
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opens = 0
+        self.short_circuits = 0
+        self._next_probe = 0.0
+
+    @property
+    def closed(self):
+        return self.state == STATE_CLOSED
+
+    def allow_request(self):
+        """Return True when a request may be sent, counting the rejected ones."""
+        if self.state == STATE_OPEN:
+            self.short_circuits += 1
+            return False
+        return True
+
+    def probe_due(self):
+        """Switch an open circuit to half-open once its backoff delay has passed."""
+        if self.state == STATE_OPEN and time.monotonic() >= self._next_probe:
+            self.state = STATE_HALF_OPEN
+        return self.state != STATE_OPEN
+
+    def record_success(self):
+        if self.state != STATE_CLOSED:
+            _LOGGER.info(f"{self._name}: Router is reachable again")
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opens = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN or (
+            self.state == STATE_CLOSED and self.failures >= self._threshold
+        ):
+            self.opens += 1
+            delay = min(self._backoff_max, self._backoff_base * 2 ** (self.opens - 1))
+            delay = random.uniform(delay / 2, delay)
+            self._next_probe = time.monotonic() + delay
+            if self.state == STATE_CLOSED:
+                _LOGGER.warning(
+                    f"{self._name}: Router is not responding, polling paused (next check in {delay:.0f} seconds)"
+                )
+            else:
+                _LOGGER.debug(f"{self._name}: Router is still not responding, next check in {delay:.0f} seconds")
+            self.state = STATE_OPEN
+
+    def as_dict(self):
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opens": self.opens,
+            "short_circuits": self.short_circuits,
+            "next_probe_seconds": (
+                round(max(0.0, self._next_probe - time.monotonic()), 1)
+                if self.state == STATE_OPEN
+                else None
+            ),
+        }
@@ -0,0 +1,55 @@
+"""Persistent cache of the firmware flavor detected for each router."""
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+import time
+
+from .const import DOMAIN, CAPABILITY_CACHE_TTL
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.capabilities"
+SAVE_DELAY = 10
+
+FLAVOR_BETA_UI = "beta_ui"
+FLAVOR_MOBILE = "mobile"
+FLAVOR_PC = "pc"
+
+
+class IPTimeCapabilityCache:
+    """Beta UI / mobile / PC flavor, mesh and product name per router URL."""
+
+    def __init__(self, hass, ttl=CAPABILITY_CACHE_TTL):
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._ttl = ttl
+        self._data = {}
+        self._loaded = False
+
+    async def async_load(self):
+        """Load the cache from .storage once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._data = await self._store.async_load() or {}
+
+    def get(self, url):
+        """Return the cached entry for url, or None when missing or expired."""
+        entry = self._data.get(url)
+        if entry is None or time.time() - entry.get("updated", 0) > self._ttl:
+            return None
+        return entry
+
+    @callback
+    def async_set(self, url, flavor, mesh, product=None):
+        entry = {"flavor": flavor, "mesh": mesh, "product": product}
+        current = self._data.get(url)
+        if current is not None and all(current.get(key) == value for key, value in entry.items()):
+            if time.time() - current.get("updated", 0) < self._ttl / 2:
+                return
+        entry["updated"] = time.time()
+        self._data[url] = entry
+        self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
+
+    @callback
+    def async_invalidate(self, url):
+        if self._data.pop(url, None) is not None:
+            self._store.async_delay_save(lambda: self._data, SAVE_DELAY)
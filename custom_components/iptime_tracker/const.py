@@ -6,8 +6,46 @@ CONF_PASSWORD = 'iptime_pw'
 CONF_TARGET = 'targets'
 CONF_NAME = 'name'
 CONF_MAC = 'mac'
+CONF_ROUTERS = 'routers'
+CONF_MAX_CONCURRENCY = 'max_concurrency'
+CONF_STAGGER = 'stagger_seconds'
+CONF_FORCE_UPDATE = 'force_update_seconds'
+CONF_MIN_INTERVAL = 'min_interval_seconds'
+CONF_MAX_INTERVAL = 'max_interval_seconds'
+CONF_METRIC_SENSORS = 'metric_sensors'
+CONF_SYSLOG_PORT = 'syslog_port'
+CONF_RECONCILE_INTERVAL = 'reconcile_interval_seconds'
+CONF_HISTORY_SAMPLES = 'history_samples'
+CONF_HISTORY_FILE = 'history_file'
+CONF_TRACK_ALL = 'track_all'
+CONF_TRACK_OUIS = 'track_ouis'
+CONF_TRACK_NAMES = 'track_names'
+CONF_TRACK_EXPIRE = 'track_expire_seconds'
+CONF_PARSE_MODE = 'parse_mode'
+CONF_POLL_DEADLINE = 'poll_deadline_seconds'
+SERVICE_DIAGNOSTICS = 'diagnostics'
+SERVICE_HISTORY = 'history'
+EVENT_READY = f'{DOMAIN}_ready'
 DEFAULT_INTERVAL = 5
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_FORCE_UPDATE = 60
+DEFAULT_RECONCILE_INTERVAL = 60
+DEFAULT_HISTORY_SAMPLES = 360
+DEFAULT_TRACK_EXPIRE = 600
+# 2026.10.18. 응답 파싱 위치: loop(이벤트 루프), thread(스레드 pool), process(프로세스 pool)
+PARSE_MODE_LOOP = 'loop'
+PARSE_MODE_THREAD = 'thread'
+PARSE_MODE_PROCESS = 'process'
+DEFAULT_PARSE_MODE = PARSE_MODE_THREAD
+PARSE_WORKERS = 2
+DEFAULT_POLL_DEADLINE = 5
+LOOP_LAG_INTERVAL = 0.25
 RSS_LIMIT = -81
+RSS_MARGIN = 5
+# 2026.10.18. RSSI 평활화(EWMA)와 히스테리시스: RSS_EXIT 아래로 내려가면 not_home, RSS_ENTER 이상이면 다시 home
+RSS_ENTER = RSS_LIMIT + 3
+RSS_EXIT = RSS_LIMIT - 3
+RSS_ALPHA = 0.3
 
 HOSTINFO_URN = '/login/hostinfo2.cgi'
 LOGIN_URN = '/sess-bin/login_handler.cgi'
@@ -23,4 +61,22 @@ M_MESH_URN = '/cgi/iux_get.cgi?tmenu=sysconf&smenu=info&act=status'
 MESH_STATION_URN = '/easymesh/api.cgi?key=topology'
 BETA_UI_URN = '/ui/'
 BETA_SERVICE_URN = '/cgi/service.cgi'
+BETA_STATIONS_METHOD = 'network/interface/lan/stations'
+BETA_MESH_METHOD = 'easymesh/info'
+BETA_SESSION_UPDATE_METHOD = 'session/update'
+BETA_ENDPOINTS = {
+    BETA_STATIONS_METHOD: 'beta_stations',
+    BETA_MESH_METHOD: 'beta_check_mesh',
+    BETA_SESSION_UPDATE_METHOD: 'beta_session_update',
+}
 TIME_OUT = 5
+HISTORY_RATE_WINDOW = 60
+CAPABILITY_CACHE_TTL = 7 * 24 * 60 * 60
+SESSION_REFRESH_INTERVAL = 60
+LOGIN_BACKOFF_BASE = 5
+LOGIN_BACKOFF_MAX = 600
+# 2026.10.18. 연속 BREAKER_THRESHOLD회 응답이 없으면 조회를 멈추고, 백오프 간격마다 가벼운 확인 요청만 보냅니다.
+BREAKER_THRESHOLD = 3
+BREAKER_BACKOFF_BASE = 10
+BREAKER_BACKOFF_MAX = 600
+PROBE_TIMEOUT = 2
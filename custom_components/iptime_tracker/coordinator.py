@@ -0,0 +1,201 @@
+"""Per-router update coordinator."""
+import asyncio
+import fnmatch
+import logging
+import re
+import time
+
+from .const import RSS_EXIT, RSS_MARGIN
+from .station import Station
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def normalize_mac(mac):
+    """Return the MAC address in the AA-BB-CC-DD-EE-FF form used as index key."""
+    return mac.strip().upper().replace(":", "-")
+
+
+def index_stations(result_dict):
+    """Index a station table by normalized MAC address."""
+    return {
+        normalize_mac(mac): station
+        for mac, station in result_dict.items()
+        if isinstance(station, Station)
+    }
+
+
+class IPTimeTrackAll:
+    """Trackers for every station of a router that passes the OUI / name filters.
+
+    Sensors are created by create_sensor(mac) on first sight, indexed by
+    normalized MAC, and dropped after expire without being seen.
+    """
+
+    def __init__(self, create_sensor, ouis=None, names=None, expire=None):
+        self._create_sensor = create_sensor
+        self._ouis = tuple(normalize_mac(oui) for oui in ouis or ())
+        self._names = [re.compile(fnmatch.translate(name), re.I) for name in names or ()]
+        self._expire = expire.total_seconds() if expire is not None else None
+        self.sensors = {}
+        self._last_seen = {}
+
+    def matches(self, key, station):
+        if self._ouis and not key.startswith(self._ouis):
+            return False
+        if self._names:
+            name = station.name
+            return name is not None and any(pattern.match(name) for pattern in self._names)
+        return True
+
+    def update(self, stations, targets, now):
+        """Add trackers for new stations and return the expired ones."""
+        sensors = self.sensors
+        last_seen = self._last_seen
+        for key, station in stations.items():
+            if key in sensors:
+                last_seen[key] = now
+            elif key not in targets and self.matches(key, station):
+                sensors[key] = self._create_sensor(key)
+                last_seen[key] = now
+
+        expired = []
+        if self._expire is not None:
+            for key, seen in list(last_seen.items()):
+                if now - seen > self._expire:
+                    del last_seen[key]
+                    expired.append(sensors.pop(key))
+        return expired
+
+
+class IPTimeCoordinator:
+    """Fetch one router once per cycle and dispatch the result to its trackers."""
+
+    def __init__(self, api, sensors, async_see, force_update=None, adaptive=None):
+        self.api = api
+        self.sensors = sensors
+        self.stations = {}
+        self._async_see = async_see
+        self._adaptive = adaptive
+        # 상태가 바뀌지 않아도 force_update 간격마다 다시 보고합니다. (0: 매번 보고)
+        self._force_update = force_update.total_seconds() if force_update is not None else 0
+        self._reported = {}
+        # 2026.10.18. syslog 이벤트 후 즉시 조회를 요청하는 콜백 (scheduler.async_request)
+        self.request_poll = None
+        # 2026.10.18. targets 외의 모든 단말을 추적 (IPTimeTrackAll)
+        self.track_all = None
+        # 2026.10.18. 정규화된 MAC별 트래커 (syslog 이벤트마다 전체를 찾지 않도록)
+        self._targets = {}
+        for sensor in sensors:
+            self._targets.setdefault(sensor._mac_key, []).append(sensor)
+
+    async def async_poll(self):
+        """Poll the router and report every tracker.
+        Returns the delay until the next poll when adaptive polling is enabled.
+        """
+        start = time.perf_counter()
+        updated = await self.api.async_update()
+        if not self.api.ready:
+            # 2026.10.18. 첫 재실체크가 성공하기 전에는 보고하지 않아, 복원된 상태(또는 unknown)를 유지합니다.
+            return None
+        self.api.metrics.record_poll(time.perf_counter() - start)
+        result_dict = self.api.result
+        previous = self.stations
+        self.stations = index_stations(result_dict)
+        # 2026.10.18. 한 번의 조회에 포함된 모든 단말의 RSSI를 한꺼번에 평활화하여 상태 결정
+        # 실패한 조회는 평활화 값을 바꾸지 않습니다.
+        if result_dict.get("session"):
+            self.api.signal.apply(self.stations, result_dict.get("sources"))
+
+        urgent = False
+        history = self.api.history
+        now = time.time()
+        for sensor in self.sensors:
+            was_present = sensor._mac_key in previous
+            sensor.update(result_dict, self.stations)
+            station = self.stations.get(sensor._mac_key)
+            if station is not None and history is not None:
+                history.record(sensor._mac_key, now, station)
+            if station is None:
+                # 기존에 있던 단말이 사라졌거나, not_home 확정을 기다리는 중
+                # 2026.10.18. 조회하지 못했거나 단말의 목록을 받지 못한 경우, 상태를 알 수 없는(N/A) 단말은 조회를 앞당기지 않습니다.
+                if updated and sensor._source_responded() and (
+                    was_present or sensor.state not in ("not_home", "N/A")
+                ):
+                    urgent = True
+            else:
+                rssi = self.api.signal.smoothed(sensor._mac_key)
+                if rssi is not None and rssi < RSS_EXIT + RSS_MARGIN:
+                    urgent = True
+
+        if self.track_all is not None:
+            # 자동 추적 단말은 조회 간격(urgent)에 영향을 주지 않습니다.
+            # 일부 대역 / MESH 목록을 받지 못한 조회로는 추가하거나 만료시키지 않습니다.
+            if result_dict.get("session") and all(result_dict.get("sources", {}).values()):
+                for sensor in self.track_all.update(self.stations, self._targets, time.monotonic()):
+                    self._reported.pop(sensor, None)
+            for sensor in self.track_all.sensors.values():
+                sensor.update(result_dict, self.stations)
+
+        await self._async_report()
+
+        if self._adaptive is None:
+            return None
+        if not result_dict.get("session"):
+            return self._adaptive.update(False, True)
+        return self._adaptive.update(urgent, previous.keys() != self.stations.keys())
+
+    async def async_station_event(self, mac, joined):
+        """Apply a syslog association event to the trackers of the station.
+        Joins are reported right away; leaves are confirmed by an immediate poll
+        so that roaming between bands or mesh agents is not reported as not_home.
+        """
+        key = normalize_mac(mac)
+        sensors = list(self._targets.get(key, ()))
+        if self.track_all is not None and key in self.track_all.sensors:
+            sensors.append(self.track_all.sensors[key])
+        if not sensors:
+            return
+        _LOGGER.debug(f"{self.api._url}: {key} {'joined' if joined else 'left'} (syslog)")
+        for sensor in sensors:
+            sensor.station_event(joined)
+        if joined:
+            await self._async_report()
+        if self.request_poll is not None:
+            self.request_poll()
+
+    async def _async_report(self):
+        """Call async_see only for trackers whose presence changed.
+        Connection time and traffic attributes are refreshed every force_update seconds.
+        Nothing is reported before the router is ready.
+        """
+        if not self.api.ready:
+            return
+        now = time.monotonic()
+        pending = []
+        sensors = self.sensors
+        if self.track_all is not None:
+            sensors = [*sensors, *self.track_all.sensors.values()]
+        for sensor in sensors:
+            presence = sensor.presence
+            reported = self._reported.get(sensor)
+            if (
+                reported is not None
+                and now - reported[1] < self._force_update
+                and reported[0] == presence
+            ):
+                continue
+            self._reported[sensor] = (presence, now)
+            state = sensor.state
+            attributes = sensor.state_attributes
+            pending.append(
+                self._async_see(
+                    mac=f"{attributes['iptime_url']}_{sensor._target_mac}",
+                    host_name=sensor.name,
+                    location_name=state,
+                    attributes=attributes,
+                    source_type="ipTIME_Tracker",
+                )
+            )
+        if pending:
+            await asyncio.gather(*pending)
@@ -0,0 +1,46 @@
+"""JSON decoding of router responses straight from the raw body."""
+import json
+
+try:
+    # Home Assistant에는 orjson이 함께 설치되어 있습니다.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _text(content):
+    # ipTIME 구형 펌웨어는 호스트 이름을 EUC-KR로 보내는 경우가 있습니다.
+    try:
+        return content.decode("utf-8")
+    except UnicodeDecodeError:
+        return content.decode("euc-kr", errors="replace")
+
+
+def decode_text(content, encoding=None):
+    """Decode a response body with its charset, falling back to UTF-8 / EUC-KR."""
+    if encoding:
+        try:
+            return content.decode(encoding, errors="replace")
+        except LookupError:
+            pass
+    # ipTIME 구형 펌웨어는 charset 없이 EUC-KR 페이지를 보내는 경우가 있습니다.
+    for encoding in ("utf-8", "euc-kr"):
+        try:
+            return content.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return content.decode("latin-1")
+
+
+def loads(content):
+    """Parse a JSON document from the response bytes.
+    Raises ValueError when the body is not JSON (e.g. a login redirect page).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # EUC-KR 본문이거나 JSON이 아닌 경우 표준 라이브러리로 다시 해석합니다.
+            pass
+    return json.loads(_text(content))
+
@@ -1,28 +1,61 @@
 """Platform for sensor integration."""
-from homeassistant.util import dt, slugify, Throttle  # for update interval
-from homeassistant.helpers.event import async_track_point_in_utc_time
-#from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import slugify
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import SupportsResponse, callback
+from homeassistant.helpers.discovery import async_load_platform
 from homeassistant.components.device_tracker import PLATFORM_SCHEMA, DeviceScanner
 import homeassistant.helpers.config_validation as cv
 from homeassistant.components.device_tracker.const import CONF_SCAN_INTERVAL
 
 from datetime import timedelta
-from bs4 import BeautifulSoup
-from json import loads
+from functools import partial
+from urllib.parse import urlsplit
 import voluptuous as vol
-import requests
 import asyncio
 import logging
+import time
 import re
 
 from .const import (
+    DOMAIN,
     CONF_URL,
     CONF_ID,
     CONF_PASSWORD,
     CONF_TARGET,
     CONF_NAME,
     CONF_MAC,
+    CONF_ROUTERS,
+    CONF_MAX_CONCURRENCY,
+    CONF_STAGGER,
+    CONF_FORCE_UPDATE,
+    CONF_MIN_INTERVAL,
+    CONF_MAX_INTERVAL,
+    CONF_METRIC_SENSORS,
+    CONF_SYSLOG_PORT,
+    CONF_RECONCILE_INTERVAL,
+    CONF_HISTORY_SAMPLES,
+    CONF_HISTORY_FILE,
+    CONF_TRACK_ALL,
+    CONF_TRACK_OUIS,
+    CONF_TRACK_NAMES,
+    CONF_TRACK_EXPIRE,
+    CONF_PARSE_MODE,
+    CONF_POLL_DEADLINE,
+    SERVICE_DIAGNOSTICS,
+    SERVICE_HISTORY,
+    EVENT_READY,
     DEFAULT_INTERVAL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_FORCE_UPDATE,
+    DEFAULT_RECONCILE_INTERVAL,
+    DEFAULT_HISTORY_SAMPLES,
+    DEFAULT_TRACK_EXPIRE,
+    DEFAULT_PARSE_MODE,
+    DEFAULT_POLL_DEADLINE,
+    PARSE_MODE_LOOP,
+    PARSE_MODE_THREAD,
+    PARSE_MODE_PROCESS,
+    HISTORY_RATE_WINDOW,
     HOSTINFO_URN,
     LOGIN_URN,
     LOGOUT_URN,
@@ -36,85 +69,313 @@ from .const import (
     M_MESH_URN,
     MESH_STATION_URN,
     TIME_OUT,
+    PROBE_TIMEOUT,
     BETA_UI_URN,
     BETA_SERVICE_URN,
-    RSS_LIMIT
+    BETA_STATIONS_METHOD,
+    BETA_MESH_METHOD,
+    BETA_SESSION_UPDATE_METHOD,
+    BETA_ENDPOINTS,
 )
+from .transport import IPTimeTransport, TRANSPORT_ERRORS
+from .breaker import IPTimeCircuitBreaker
+from .backends import (
+    BACKENDS,
+    BACKEND_BETA_UI,
+    BACKEND_MESH,
+    BACKEND_MOBILE,
+    BACKEND_PC,
+    load_backend,
+    loaded_backend,
+)
+from .worker import IPTimeParseWorker
+from .scheduler import IPTimeScheduler, AdaptiveInterval
+from .coordinator import IPTimeCoordinator, IPTimeTrackAll, normalize_mac
+from .capability import (
+    IPTimeCapabilityCache,
+    FLAVOR_BETA_UI,
+    FLAVOR_MOBILE,
+    FLAVOR_PC,
+)
+from .session import IPTimeSessionManager
+from .metrics import IPTimeMetrics, LoopLagMonitor
+from .station import Station
+from .decode import loads
+from .syslog import IPTimeSyslogListener
+from .rssi import IPTimeSignalFilter
+from .history import IPTimeHistory
 
 _LOGGER = logging.getLogger(__name__)
-API_LIMIT_INTERVAL = timedelta(seconds=4)
 
-PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
+TARGET_SCHEMA = vol.All(
+    cv.ensure_list,
+    [
+        {
+            vol.Required(CONF_NAME): cv.string,
+            vol.Required(CONF_MAC): cv.string,
+        }
+    ],
+)
+
+# 2026.10.18. 여러 공유기를 하나의 스케줄러로 조회 (Fleet mode)
+ROUTER_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_URL): cv.string,
         vol.Required(CONF_ID): cv.string,
         vol.Required(CONF_PASSWORD): cv.string,
-        vol.Required(CONF_TARGET): vol.All(
-            cv.ensure_list,
-            [
-                {
-                    vol.Required(CONF_NAME): cv.string,
-                    vol.Required(CONF_MAC): cv.string,
-                }
-            ],
-        ),
+        vol.Optional(CONF_TARGET, default=[]): TARGET_SCHEMA,
+        vol.Optional(CONF_SCAN_INTERVAL): cv.time_period,
+        vol.Optional(CONF_MIN_INTERVAL): cv.time_period,
+        vol.Optional(CONF_MAX_INTERVAL): cv.time_period,
     }
 )
 
+PLATFORM_SCHEMA = vol.All(
+    PLATFORM_SCHEMA.extend(
+        {
+            vol.Inclusive(CONF_URL, "router"): cv.string,
+            vol.Inclusive(CONF_ID, "router"): cv.string,
+            vol.Inclusive(CONF_PASSWORD, "router"): cv.string,
+            vol.Optional(CONF_TARGET): TARGET_SCHEMA,
+            vol.Optional(CONF_ROUTERS): vol.All(cv.ensure_list, [ROUTER_SCHEMA]),
+            vol.Optional(
+                CONF_MAX_CONCURRENCY, default=DEFAULT_MAX_CONCURRENCY
+            ): cv.positive_int,
+            vol.Optional(CONF_STAGGER): cv.time_period,
+            vol.Optional(CONF_MIN_INTERVAL): cv.time_period,
+            vol.Optional(CONF_MAX_INTERVAL): cv.time_period,
+            vol.Optional(
+                CONF_FORCE_UPDATE, default=timedelta(seconds=DEFAULT_FORCE_UPDATE)
+            ): cv.time_period,
+            vol.Optional(CONF_HISTORY_SAMPLES, default=DEFAULT_HISTORY_SAMPLES): vol.All(
+                vol.Coerce(int), vol.Range(min=0)
+            ),
+            vol.Optional(CONF_HISTORY_FILE, default=False): cv.boolean,
+            vol.Optional(CONF_TRACK_ALL, default=False): cv.boolean,
+            vol.Optional(CONF_TRACK_OUIS, default=[]): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(CONF_TRACK_NAMES, default=[]): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(
+                CONF_TRACK_EXPIRE, default=timedelta(seconds=DEFAULT_TRACK_EXPIRE)
+            ): cv.time_period,
+            vol.Optional(CONF_METRIC_SENSORS, default=False): cv.boolean,
+            vol.Optional(CONF_SYSLOG_PORT): cv.port,
+            vol.Optional(
+                CONF_RECONCILE_INTERVAL, default=timedelta(seconds=DEFAULT_RECONCILE_INTERVAL)
+            ): cv.time_period,
+            vol.Optional(
+                CONF_POLL_DEADLINE, default=timedelta(seconds=DEFAULT_POLL_DEADLINE)
+            ): cv.time_period,
+            vol.Optional(CONF_PARSE_MODE, default=DEFAULT_PARSE_MODE): vol.In(
+                [PARSE_MODE_LOOP, PARSE_MODE_THREAD, PARSE_MODE_PROCESS]
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(CONF_URL, CONF_ROUTERS),
+)
+
 
 async def async_setup_scanner(hass, config_entry, async_see, discovery_info=None):
     """Set up the sensor platform."""
-    url = config_entry.get(CONF_URL)
-    user_id = config_entry.get(CONF_ID)
-    user_pw = config_entry.get(CONF_PASSWORD)
-    targets = config_entry.get(CONF_TARGET)
-
     scan_interval = config_entry.get(
         CONF_SCAN_INTERVAL, timedelta(seconds=DEFAULT_INTERVAL)
     )
-    sensors = []
-
-    iAPI = IPTimeAPI(hass, url, user_id, user_pw)
-    await iAPI.async_update()
-
-    for target in targets:
-        iSensor = IPTimeSensor(target["name"], target["mac"], iAPI)
-        await iSensor.async_update()
-        sensors += [iSensor]
+    routers = list(config_entry.get(CONF_ROUTERS, []))
+    if CONF_URL in config_entry:
+        routers.insert(0, config_entry)
+
+    scheduler = IPTimeScheduler(
+        hass,
+        config_entry.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+        config_entry.get(CONF_STAGGER),
+    )
+    apis = []
+
+    # 2026.10.18. 공유기별 펌웨어 정보(Beta UI/모바일/PC, MESH)를 저장해 재시작 시 확인 과정을 생략
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "capabilities" not in domain_data:
+        domain_data["capabilities"] = IPTimeCapabilityCache(hass)
+    capabilities = domain_data["capabilities"]
+    await capabilities.async_load()
+    # 2026.10.18. 응답 파싱은 이벤트 루프 밖(스레드 / 프로세스 pool)에서 수행합니다.
+    # 루프 지연 시간은 metric_sensors의 이벤트 루프 지연 센서가 있을 때만 기록합니다.
+    if "worker" not in domain_data:
+        worker = domain_data["worker"] = IPTimeParseWorker(
+            config_entry.get(CONF_PARSE_MODE, DEFAULT_PARSE_MODE)
+        )
+        loop_monitor = domain_data["loop_monitor"] = LoopLagMonitor(hass.loop)
+
+        @callback
+        def stop_worker(event):
+            loop_monitor.stop()
+            worker.shutdown()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_worker)
+    worker = domain_data["worker"]
+    registered = domain_data.setdefault("apis", {})
+    _async_register_services(hass)
+
+    # 2026.10.18. 공유기 syslog의 무선 연결/해제 이벤트로 재실을 즉시 갱신하고, 조회는 느린 재확인 주기로 전환
+    listener = None
+    if CONF_SYSLOG_PORT in config_entry:
+        listener = await _async_get_syslog_listener(hass, config_entry[CONF_SYSLOG_PORT])
+        if listener is not None:
+            scan_interval = config_entry.get(
+                CONF_SCAN_INTERVAL,
+                config_entry.get(CONF_RECONCILE_INTERVAL, timedelta(seconds=DEFAULT_RECONCILE_INTERVAL)),
+            )
 
-    async def async_update(now):
-        for sensor in sensors:
-            await sensor.async_update()
-        await asyncio.gather(
-            *(
-                async_see(
-                    mac=f"{sensor.state_attributes['iptime_url']}_{sensor._target_mac}",
-                    host_name=sensor.name,
-                    location_name=sensor.state,
-                    attributes=sensor.state_attributes,
-                    source_type="ipTIME_Tracker",
-                )
-                for sensor in sensors
+    for router in routers:
+        iAPI = IPTimeAPI(
+            hass, router[CONF_URL], router[CONF_ID], router[CONF_PASSWORD], capabilities, worker
+        )
+        sensors = [
+            IPTimeSensor(target["name"], target["mac"], iAPI)
+            for target in router.get(CONF_TARGET, [])
+        ]
+        iAPI.poll_deadline = config_entry.get(
+            CONF_POLL_DEADLINE, timedelta(seconds=DEFAULT_POLL_DEADLINE)
+        ).total_seconds()
+        apis.append(iAPI)
+        registered[iAPI._url] = iAPI
+        # 2026.10.18. 단말별 RSSI / 속도 / 누적 바이트 샘플을 메모리(또는 mmap 파일)에 보관
+        history_samples = config_entry.get(CONF_HISTORY_SAMPLES, DEFAULT_HISTORY_SAMPLES)
+        if history_samples:
+            path = None
+            if config_entry.get(CONF_HISTORY_FILE):
+                path = hass.config.path(".storage", f"{DOMAIN}.history.{slugify(iAPI._url)}")
+            iAPI.history = await hass.async_add_executor_job(
+                IPTimeHistory, [sensor._mac_key for sensor in sensors], history_samples, path
+            )
+        interval = router.get(CONF_SCAN_INTERVAL, scan_interval)
+        # 2026.10.18. 재실 변화에 따라 min ~ max 사이에서 조회 간격을 조절
+        adaptive = AdaptiveInterval(
+            interval,
+            router.get(CONF_MIN_INTERVAL, config_entry.get(CONF_MIN_INTERVAL)),
+            router.get(CONF_MAX_INTERVAL, config_entry.get(CONF_MAX_INTERVAL)),
+        )
+        coordinator = IPTimeCoordinator(
+            iAPI,
+            sensors,
+            async_see,
+            config_entry.get(CONF_FORCE_UPDATE, timedelta(seconds=DEFAULT_FORCE_UPDATE)),
+            adaptive,
+        )
+        if config_entry.get(CONF_TRACK_ALL):
+            coordinator.track_all = IPTimeTrackAll(
+                partial(_create_discovered_sensor, iAPI),
+                config_entry.get(CONF_TRACK_OUIS),
+                config_entry.get(CONF_TRACK_NAMES),
+                config_entry.get(CONF_TRACK_EXPIRE, timedelta(seconds=DEFAULT_TRACK_EXPIRE)),
+            )
+        scheduler.add(iAPI._url, coordinator.async_poll, adaptive.interval)
+        iAPI.semaphore = scheduler.semaphore
+        iAPI.request_poll = partial(scheduler.async_request, iAPI._url)
+        if listener is not None:
+            coordinator.request_poll = iAPI.request_poll
+            # 공유기 주소 확인(DNS)을 기다리지 않고 설정을 마칩니다.
+            hass.async_create_task(listener.async_add_router(urlsplit(iAPI._url).hostname, coordinator))
+
+    async def async_close(event):
+        scheduler.async_stop()
+        if listener is not None:
+            listener.async_stop()
+        await asyncio.gather(*(api.async_close() for api in apis))
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_close)
+    scheduler.async_start()
+
+    if config_entry.get(CONF_METRIC_SENSORS):
+        hass.async_create_task(
+            async_load_platform(
+                hass, "sensor", DOMAIN, {"urls": [api._url for api in apis]}, {}
             )
         )
+    return True
 
-    async def _async_update_interval(now):
-        try:
-            await async_update(now)
-        finally:
-            if not hass.is_stopping:
-                async_track_point_in_utc_time(
-                    hass, _async_update_interval, dt.utcnow() + scan_interval
-                )
 
-    await _async_update_interval(None)
-    return True
+def _create_discovered_sensor(api, mac):
+    """Tracker of a station found by track_all, named after its MAC address."""
+    return IPTimeSensor(mac.replace("-", "").lower(), mac, api)
+
+
+async def _async_get_syslog_listener(hass, port):
+    """Syslog listener of port, shared by every platform entry using it.
+
+    Returns None when the port cannot be bound.
+    """
+    listeners = hass.data[DOMAIN].setdefault("syslog_listeners", {})
+    if port not in listeners:
+
+        async def async_start():
+            listener = IPTimeSyslogListener(hass, port)
+            try:
+                await listener.async_start()
+            except OSError as err:
+                _LOGGER.error(f"Cannot listen for syslog on port {port}: {err}")
+                return None
+            return listener
+
+        # 동시에 설정되는 항목도 같은 포트를 한 번만 열도록 시작 작업 자체를 공유합니다.
+        listeners[port] = hass.async_create_task(async_start())
+    return await listeners[port]
+
+
+def _async_register_services(hass):
+    """Register the diagnostics and history services once for every router."""
+    if hass.services.has_service(DOMAIN, SERVICE_DIAGNOSTICS):
+        return
+
+    async def async_diagnostics(call):
+        domain_data = hass.data[DOMAIN]
+        return {
+            "routers": {url: api.diagnostics() for url, api in domain_data["apis"].items()},
+            "parse_mode": domain_data["worker"].mode,
+            "event_loop": domain_data["loop_monitor"].as_dict(),
+            "backends": [name for name in BACKENDS if loaded_backend(name) is not None],
+        }
+
+    async def async_history(call):
+        mac = normalize_mac(call.data[CONF_MAC])
+        since = time.time() - call.data["minutes"] * 60
+        apis = hass.data[DOMAIN]["apis"]
+        return {
+            "routers": {
+                url: api.history.samples(mac, since)
+                for url, api in apis.items()
+                if api.history is not None and mac in api.history
+            }
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DIAGNOSTICS,
+        async_diagnostics,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_HISTORY,
+        async_history,
+        schema=vol.Schema(
+            {
+                vol.Required(CONF_MAC): cv.string,
+                vol.Optional("minutes", default=10): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _consume_result(task):
+    """Retrieve the exception of a cancelled poll request so asyncio does not log it."""
+    if not task.cancelled():
+        task.exception()
 
 
 class IPTimeAPI(DeviceScanner):
     """ipTIME API"""
 
-    def __init__(self, hass, url, user_id, user_pw):
+    def __init__(self, hass, url, user_id, user_pw, capabilities=None, worker=None):
         """Initialize the ipTIME API"""
         self._hass = hass
         self._user_id = user_id
@@ -123,6 +384,9 @@ class IPTimeAPI(DeviceScanner):
         self._ismesh = False
         # 2024.05.07. Beta UI 지원
         self._beta_ui = False
+        self._product_name = None
+        self._capabilities = capabilities
+        self._worker = worker or IPTimeParseWorker()
 
         self.result = {}
         if not "http" in url:
@@ -145,58 +409,265 @@ class IPTimeAPI(DeviceScanner):
         self.json_headers['Content-type'] = "application/json; charset=utf-8"
 
         self.efm_session_id = None
-        #self.session = async_get_clientsession(self._hass)
-        self.loop = asyncio.get_event_loop()
+        # 2026.10.18. 공유기마다 keep-alive 연결을 유지하는 비동기 전송 계층 사용
+        # 2026.10.18. 엔드포인트별 지연 시간, 응답 크기, 파싱 시간, 오류 횟수 기록
+        self.metrics = IPTimeMetrics()
+        # 2026.10.18. 응답 없는 공유기는 회로를 열어 요청을 보내지 않고, 백오프 간격으로 확인 요청만 보냅니다.
+        self.breaker = IPTimeCircuitBreaker(self._url)
+        self._session = IPTimeTransport(self._url, metrics=self.metrics, breaker=self.breaker)
+        self._session_manager = IPTimeSessionManager()
+        # 2026.10.18. Beta UI batch 요청 지원 여부 (None: 확인 전)
+        self._beta_batch = None
+        # 2026.10.18. MESH agent / backhaul 정보와 이전 조회의 MESH 단말 목록
+        self._mesh_topology = {}
+        self._mesh_stations = {}
+        # 2026.10.18. 대역별 (연결 시간을 제외한 응답 본문의 fingerprint, 파싱 결과)
+        self._parsed = {}
+        self.signal = IPTimeSignalFilter()
+        self.history = None
+        # 2026.10.18. 백그라운드 로그인과 준비 상태 (첫 재실체크 성공)
+        self.request_poll = None
+        # 2026.10.18. 백그라운드 로그인도 조회와 같은 동시 실행 제한(max_concurrency)을 따릅니다.
+        self.semaphore = None
+        # 2026.10.18. 한 번의 재실체크(모든 대역 / MESH 요청)에 허용하는 시간(초)
+        self.poll_deadline = DEFAULT_POLL_DEADLINE
+        self.ready = False
+        self.ready_seconds = None
+        self._created = time.monotonic()
+        self._login_task = None
+        self._login_checked = False
+
+    async def async_close(self):
+        """Stop a pending login and close the router connections and the history file."""
+        if self._login_task is not None:
+            self._login_task.cancel()
+        await self._session.close()
+        if self.history is not None and self._hass is not None:
+            await self._hass.async_add_executor_job(self.history.close)
+
+    async def backend(self, name):
+        """Return the parsers of a firmware flavor, importing them on first use.
+        # 2026.10.18. 감지된 펌웨어의 파서만 불러오므로 PC UI가 아니면 BeautifulSoup을 import하지 않습니다.
+        """
+        module = loaded_backend(name)
+        if module is not None:
+            return module
+        if self._hass is None:
+            return load_backend(name)
+        return await self._hass.async_add_executor_job(load_backend, name)
+
+    @property
+    def flavor(self):
+        """Return the detected firmware flavor."""
+        if self._beta_ui:
+            return FLAVOR_BETA_UI
+        elif self._ismobile:
+            return FLAVOR_MOBILE
+        return FLAVOR_PC
+
+    def diagnostics(self):
+        """Return the detected firmware, session state and endpoint metrics."""
+        return {
+            "flavor": self.flavor,
+            "mesh": self._ismesh,
+            "product_name": self._product_name,
+            "ready": self.ready,
+            "ready_seconds": round(self.ready_seconds, 1) if self.ready_seconds is not None else None,
+            "logging_in": self._login_task is not None,
+            "logged_in": self.efm_session_id is not None,
+            "login_failures": self._session_manager.login_failures,
+            "breaker": self.breaker.as_dict(),
+            "stations": sum(1 for value in self.result.values() if isinstance(value, Station)),
+            "mesh_topology": self._mesh_topology,
+            "metrics": self.metrics.as_dict(),
+        }
 
-    @Throttle(API_LIMIT_INTERVAL)
     async def async_update(self):
-        """Update function for updating api information."""
+        """Update function for updating api information.
+        # 2026.10.18. IPTimeCoordinator가 주기마다 한 번만 호출하므로 Throttle을 제거하였습니다.
+        """
+        # 2026.10.18. 회로가 열려 있으면 조회하지 않고 "연결 불가"(빈 결과)로 처리하며,
+        # 백오프 간격이 지나면 확인 요청 하나만 보낸 뒤 응답이 있을 때만 조회를 이어갑니다.
+        if not self.breaker.closed:
+            if not self.breaker.probe_due() or not await self.async_probe():
+                self.result = {}
+                return False
+            # 연결할 수 없어 실패한 로그인의 백오프는 기다리지 않습니다.
+            self._session_manager.reset_backoff()
+
+        # 2026.10.18. 백그라운드 로그인 중에는 efm_session_id가 있어도 MESH 확인과 첫 재실체크가 끝나지 않았으므로 조회하지 않습니다.
+        if self._login_task is not None:
+            return False
+
         # Step 4. (반복)로그인되어 있을 경우, 재실체크 수행
         if self.efm_session_id:
-            if self._beta_ui:
+            if self._login_checked:
+                # 2026.10.18. 로그인 직후 수행한 첫 재실체크 결과를 그대로 사용합니다.
+                self._login_checked = False
+            elif self._beta_ui:
                 self.result = await self.beta_ui_wlan_check()
-                await self.session_update_beta_ui()
             elif self._ismobile:
                 self.result = await self.m_wlan_check()
             else:
                 self.result = await self.wlan_check()
+            if not self.ready and self.result.get("session"):
+                self._async_set_ready()
+            return True
+
+        # 2026.10.18. 로그인 실패가 반복되면 지수 백오프(jitter 포함) 이후에 다시 시도합니다.
+        if not self._session_manager.can_login():
+            return False
+        if self._hass is None:
+            return await self.login_attempt()
+        # 2026.10.18. 펌웨어 확인과 로그인은 백그라운드에서 수행합니다.
+        # 응답 없는 공유기의 확인 과정(요청마다 TIME_OUT)이 설정이나 다른 공유기의 조회를 지연시키지 않습니다.
+        if self._login_task is None:
+            self._login_task = self._hass.async_create_background_task(
+                self.async_login_task(), f"{DOMAIN} login {self._url}"
+            )
+        return False
+
+    async def async_probe(self):
+        """Half-open check of an unreachable router: one cheap request with a short timeout."""
+        try:
+            await self._session.get(self._url + "/", headers=self.headers, timeout=PROBE_TIMEOUT, endpoint="probe")
+        except Exception:
+            return False
+        return True
+
+    async def async_login_task(self):
+        """Log in in the background and request a poll as soon as it succeeds.
+        The login holds a slot of the scheduler semaphore like a poll does.
+        """
+        try:
+            if self.semaphore is not None:
+                async with self.semaphore:
+                    logged_in = await self.login_attempt()
+            else:
+                logged_in = await self.login_attempt()
+            if logged_in and self.request_poll is not None:
+                self.request_poll()
+        except Exception:
+            _LOGGER.exception(f"{self._url}: Unexpected error while logging in")
+        finally:
+            self._login_task = None
 
+    async def login_attempt(self):
+        """Run one login, recording the result for the login backoff."""
+        try:
+            logged_in = await self.async_login()
+        except Exception:
+            self._session_manager.login_failed()
+            raise
+        if logged_in:
+            self._session_manager.login_succeeded()
         else:
-            # Step 1. (최초 1회)Beta UI 지원 여부 확인
-            if await self.verify_beta_ui():
-                # Beta UI를 지원하면 - Beta UI 로그인, MESH 체크, 재실체크
-                _LOGGER.info(f"[ipTIME-BetaUI] {self._url}")
-                self._beta_ui = True
-                if await self.login_beta_ui():
-                    await self.beta_ui_check_mesh()
-                    await self.beta_ui_wlan_check()
-                    return True
-                else:
-                    return False
+            delay = self._session_manager.login_failed()
+            _LOGGER.debug(f"{self._url}: Login retry after {delay:.0f} seconds")
+        self._login_checked = logged_in
+        return logged_in
+
+    @callback
+    def _async_set_ready(self):
+        """Mark the first successful check after setup."""
+        self.ready = True
+        self.ready_seconds = time.monotonic() - self._created
+        _LOGGER.info(f"{self._url}: Ready after {self.ready_seconds:.1f} seconds")
+        if self._hass is not None:
+            self._hass.bus.async_fire(
+                EVENT_READY,
+                {"iptime_url": self._url, "flavor": self.flavor, "seconds": round(self.ready_seconds, 1)},
+            )
 
-            # Step 2. (최초 1회)모바일 페이지 지원 여부 확인
-            if not await self.verify_mobile():
+    async def async_login(self):
+        """Detect the firmware flavor, login and run the first check."""
+        # Step 0. 저장된 펌웨어 정보가 있으면 UI 확인 과정 없이 바로 로그인
+        cached = self._capabilities.get(self._url) if self._capabilities else None
+        if cached:
+            logged_in = await self.login_cached(cached)
+            if logged_in:
+                return True
+            if logged_in is None:
+                # 2026.10.18. 공유기가 응답하지 않으면 저장된 정보를 유지하고, 다음 시도에서 같은 방식으로 로그인합니다.
+                return False
+            _LOGGER.debug(f"{self._url}: Cached firmware info is out of date, checking again.")
+            self._capabilities.async_invalidate(self._url)
+
+        # Step 1. (최초 1회)Beta UI 지원 여부 확인
+        if await self.verify_beta_ui():
+            # Beta UI를 지원하면 - Beta UI 로그인, MESH 체크, 재실체크
+            _LOGGER.info(f"[ipTIME-BetaUI] {self._url}")
+            self._beta_ui = True
+            if await self.login_beta_ui():
+                await self.beta_ui_check_mesh()
+                self.save_capabilities()
+                self.result = await self.beta_ui_wlan_check()
+                return True
+            else:
                 return False
 
-            # Step 3. (최초 1회)모바일 페이지 지원 - 모바일 로그인, MESH 체크, 재실체크
-            if self._ismobile:
-                _LOGGER.info(f"[ipTIME-Mobile] {self._url}")
-                if await self.m_login():
-                    await self.m_check_mesh()
-                    self.result = await self.m_wlan_check()
-                    return True
-                else:
-                    return False
+        # Step 2. (최초 1회)모바일 페이지 지원 여부 확인
+        if not await self.verify_mobile():
+            return False
 
-            # Step 3. (최초 1회)모바일 페이지 미지원 - PC 로그인, MESH 체크, 재실체크
+        # Step 3. (최초 1회)모바일 페이지 지원 - 모바일 로그인, MESH 체크, 재실체크
+        if self._ismobile:
+            _LOGGER.info(f"[ipTIME-Mobile] {self._url}")
+            if await self.m_login():
+                await self.m_check_mesh()
+                self.save_capabilities()
+                self.result = await self.m_wlan_check()
+                return True
             else:
-                _LOGGER.info(f"[ipTIME-PC] {self._url}")
-                if await self.login():
-                    await self.check_mesh()
-                    self.result = await self.wlan_check()
-                    return True
-                else:
-                    return False
+                return False
+
+        # Step 3. (최초 1회)모바일 페이지 미지원 - PC 로그인, MESH 체크, 재실체크
+        else:
+            _LOGGER.info(f"[ipTIME-PC] {self._url}")
+            if await self.login():
+                await self.check_mesh()
+                self.save_capabilities()
+                self.result = await self.wlan_check()
+                return True
+            else:
+                return False
+
+    async def login_cached(self, cached):
+        """Login with the cached firmware flavor, skipping the UI probes.
+        Returns None when the router did not answer, so the cache is kept.
+        """
+        flavor = cached.get("flavor")
+        self._beta_ui = flavor == FLAVOR_BETA_UI
+        self._ismobile = flavor == FLAVOR_MOBILE
+        self._product_name = cached.get("product")
+
+        if self._beta_ui:
+            logged_in = await self.login_beta_ui()
+        elif self._ismobile:
+            logged_in = await self.m_login()
+        else:
+            logged_in = await self.login()
+
+        if not logged_in:
+            self._beta_ui = False
+            self._ismobile = False
+            self._ismesh = False
+            return logged_in
+
+        self._ismesh = bool(cached.get("mesh"))
+        if self._beta_ui:
+            self.result = await self.beta_ui_wlan_check()
+        elif self._ismobile:
+            self.result = await self.m_wlan_check()
+        else:
+            self.result = await self.wlan_check()
+        return True
+
+    def save_capabilities(self):
+        """Store the detected firmware flavor for the next login."""
+        if not self._capabilities:
+            return
+        self._capabilities.async_set(self._url, self.flavor, self._ismesh, self._product_name)
 
     async def verify_beta_ui(self):
         """
@@ -205,21 +676,22 @@ class IPTimeAPI(DeviceScanner):
         try:
             # 2025.07.03. iptime 펌웨어 15.10.2 버전부터 "/cgi/service.cgi" 문자열 위치가 변경됨
             url = self._url + BETA_UI_URN + "flutter_bootstrap.js"
-            response = await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, timeout=TIME_OUT))
+            response = await self._session.get(url, headers=self.headers, timeout=TIME_OUT, endpoint="probe_beta_ui")
             if "/cgi/service.cgi" in response.text:
                 return True
             else:
                 url = self._url + BETA_UI_URN
-                response = await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, timeout=TIME_OUT))
+                response = await self._session.get(url, headers=self.headers, timeout=TIME_OUT, endpoint="probe_beta_ui")
                 if "/cgi/service.cgi" in response.text:
                     return True
             return False
-        except:
+        except Exception:
             return False
 
     async def login_beta_ui(self):
         """
         # 2024.05.07. Beta UI 지원 (/)
+        # 2026.10.18. 공유기가 응답하지 않으면 None, Beta UI 응답이 아니면 False를 돌려줍니다.
         """
         url = self._url + BETA_SERVICE_URN
         data = {
@@ -229,18 +701,31 @@ class IPTimeAPI(DeviceScanner):
                 "pw": self._user_pw
             }
         }
-        response = await self.loop.run_in_executor(None, lambda: requests.post(url, headers=self.json_headers, json=data, timeout=TIME_OUT))
-        response_json = response.json()
-        if response_json['result']:
+        try:
+            response = await self._session.post(url, headers=self.json_headers, json=data, timeout=TIME_OUT, endpoint="beta_login")
+        except TRANSPORT_ERRORS:
+            _LOGGER.debug(f"{self._url}: (B)Login request failed, the router did not respond.")
+            return None
+        try:
+            response_json = response.json()
+        except ValueError:
+            _LOGGER.debug(f"{self._url}: (B)Login Fail !! Not a Beta UI response.")
+            return False
+        if not isinstance(response_json, dict):
+            return False
+        if response_json.get('result'):
+            if 'efm_session_id' not in response.cookies:
+                _LOGGER.error(f"{self._url}: (B)Login Fail !! No session cookie.")
+                return False
             self.efm_session_id = response.cookies['efm_session_id']
             _LOGGER.debug(f"{self._url}: (B)Login Success !! [{self.efm_session_id}]")
             return True
         else:
-            if response_json['error']:
-                if response_json['error']['code'] == -31996:
+            if isinstance(response_json.get('error'), dict):
+                if response_json['error'].get('code') == -31996:
                     _LOGGER.error(f"{self._url}: (B)Login Fail !!")
                     return False
-                elif response_json['error']['code'] == -31997:
+                elif response_json['error'].get('code') == -31997:
                     _LOGGER.error(f"{self._url}: (B)Login Fail !! Check Captcha settings.")
                     return False
                 else:
@@ -249,20 +734,49 @@ class IPTimeAPI(DeviceScanner):
                     return False
         return False
 
-    async def session_update_beta_ui(self):
-        """
-        # 2024.05.07. Beta UI 지원 (/)
+    async def beta_ui_call(self, methods):
+        """Call Beta UI JSON-RPC methods and return one response per method.
+        # 2026.10.18. 펌웨어가 batch 요청을 지원하면 한 번에 보내고, 아니면 동시에 하나씩 보냅니다.
+        Failed single calls are returned as exceptions. The result of the
+        stations method is already parsed into a station table.
         """
         url = self._url + BETA_SERVICE_URN
         cookies = {"efm_session_id": self.efm_session_id}
-        data = {
-            "method":"session/update"
-        }
-        try:
-            response = await self.loop.run_in_executor(None, lambda: requests.post(url, headers=self.json_headers, json=data, cookies=cookies, timeout=TIME_OUT))
-        except:
-            return False
-        #_LOGGER.debug(f"[BetaUI 세션유지 테스트] {response.json()}")
+        beta_ui = await self.backend(BACKEND_BETA_UI)
+        if self._beta_batch is not False and len(methods) > 1:
+            data = [{"id": index, "method": method} for index, method in enumerate(methods)]
+            response = await self._session.post(url, headers=self.json_headers, json=data, cookies=cookies, timeout=TIME_OUT, endpoint="beta_batch")
+            try:
+                responses, by_id = await self.parse_timed("beta_batch", beta_ui.parse_beta_batch, response.content, methods)
+            except ValueError:
+                responses, by_id = None, False
+            # 2026.10.18. 응답마다 요청의 id가 있을 때만 batch 지원으로 확정하고, id가 없으면 순서대로 맞춰 사용합니다.
+            if responses is not None:
+                if by_id:
+                    self._beta_batch = True
+                return responses
+            _LOGGER.debug(f"{self._url}: (B)Batch response cannot be matched to the requests, using single calls")
+            self._beta_batch = False
+
+        responses = await asyncio.gather(
+            *(
+                self._session.post(url, headers=self.json_headers, json={"method": method}, cookies=cookies, timeout=TIME_OUT, endpoint=BETA_ENDPOINTS.get(method, method))
+                for method in methods
+            ),
+            return_exceptions=True,
+        )
+        result = []
+        for method, response in zip(methods, responses):
+            if isinstance(response, BaseException):
+                result.append(response)
+                continue
+            try:
+                result.append(
+                    await self.parse_timed(BETA_ENDPOINTS.get(method, method), beta_ui.parse_beta_payload, response.content, method)
+                )
+            except ValueError as err:
+                result.append(err)
+        return result
 
     async def verify_mobile(self):
         """
@@ -282,17 +796,24 @@ class IPTimeAPI(DeviceScanner):
         # Version 3.
         response = await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, timeout=TIME_OUT))
         _LOGGER.debug(await response.text())
+
+        # Version 4. (2026.10.18.)
+        # requests와 executor 대신, 헤더를 관대하게 해석하는 transport.py의 IPTimeTransport를 이용합니다.
+        # 공유기마다 keep-alive 연결을 재사용하므로 매 조회마다 TCP 연결을 새로 맺지 않습니다.
+        response = await self._session.get(url, headers=self.headers, timeout=TIME_OUT)
         """
 
         url = self._url + HOSTINFO_URN
 
         try:
-            # response = await self.session.get(
-            #    url, headers=self.headers, timeout=TIME_OUT
-            # )
-            response = await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, timeout=TIME_OUT))
+            response = await self._session.get(url, headers=self.headers, timeout=TIME_OUT, endpoint="probe_mobile")
             #_LOGGER.info(f"[verify_mobile response] {response.text}")
+        except Exception:
+            # 2026.10.18. 공유기에 연결할 수 없으면 PC UI 로그인으로 넘어가지 않고 실패로 처리합니다.
+            _LOGGER.error(f"{self._url}: The page cannot be accessed.")
+            return False
 
+        try:
             product_name = (
                 re.search(
                     re.compile(r"product_name=[ a-zA-Z0-9]+"), response.text
@@ -300,9 +821,9 @@ class IPTimeAPI(DeviceScanner):
                 .group()
                 .split("=")[1]
             )
-        except:
-            _LOGGER.error(f"{self._url}: The page cannot be accessed.")
-            return True  # False
+            self._product_name = product_name
+        except Exception:
+            product_name = None
 
         if "iux" not in response.text:
             self._ismobile = False
@@ -345,7 +866,7 @@ class IPTimeAPI(DeviceScanner):
                     f"{self._url}: [{product_name}] This page is not supported the mobile app."
                 )
                 return True
-        except:
+        except Exception:
             self._ismobile = False
             _LOGGER.error(
                 f"{self._url}: [{product_name}] Verify_mobile Function Error")
@@ -355,33 +876,19 @@ class IPTimeAPI(DeviceScanner):
         url = self._url + MESH_URN
         cookies = {"efm_session_id": self.efm_session_id}
         try:
-            # response = await self.session.get(
-            #    url, headers=self.headers, cookies=cookies, timeout=TIME_OUT
-            # )
-            response = await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, cookies=cookies, timeout=TIME_OUT))
-            soup = BeautifulSoup(response.text, "html.parser")
-            mesh_mode = soup.find("input", attrs={"id": "mode_none"})
-            if not mesh_mode:
-                self._ismesh = False
-                return False
-            if "checked" in mesh_mode.attrs:
-                self._ismesh = False
-                return False
-            else:
-                self._ismesh = True
-                return True
-        except:
+            response = await self._session.get(url, headers=self.headers, cookies=cookies, timeout=TIME_OUT, endpoint="check_mesh")
+            pc = await self.backend(BACKEND_PC)
+            self._ismesh = await self.parse_timed("check_mesh", pc.parse_pc_mesh, response.content, response.encoding)
+            return self._ismesh
+        except Exception:
             return False
 
     async def m_check_mesh(self):
         url = self._url + M_MESH_URN
         cookies = {"efm_session_id": self.efm_session_id}
         try:
-            response = await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, cookies=cookies, timeout=TIME_OUT))
-            # response = await self.session.get(
-            #     url, headers=self.headers, cookies=cookies, timeout=TIME_OUT
-            # )
-            response_json = loads(response.text)
+            response = await self._session.get(url, headers=self.headers, cookies=cookies, timeout=TIME_OUT, endpoint="check_mesh")
+            response_json = await self.parse_timed("check_mesh", loads, response.content)
 
             if "easymesh" in response_json:
                 self._ismesh = True
@@ -389,7 +896,7 @@ class IPTimeAPI(DeviceScanner):
             else:
                 self._ismesh = False
                 return False
-        except:
+        except Exception:
             return False
 
     async def beta_ui_check_mesh(self):
@@ -401,10 +908,14 @@ class IPTimeAPI(DeviceScanner):
         data = {
             "method":"easymesh/info"
         }
-        response = await self.loop.run_in_executor(None, lambda: requests.post(url, headers=self.json_headers, cookies=cookies, json=data,timeout=TIME_OUT))
+        try:
+            response = await self._session.post(url, headers=self.json_headers, cookies=cookies, json=data,timeout=TIME_OUT, endpoint="beta_check_mesh")
+            response_json = response.json()
+        except (*TRANSPORT_ERRORS, ValueError):
+            # 2026.10.18. 확인하지 못하면 MESH 설정을 바꾸지 않습니다. (재실체크의 easymesh/info로 다시 확인)
+            return False
 
-        response_json = response.json()
-        if response_json['result']:
+        if isinstance(response_json, dict) and isinstance(response_json.get('result'), dict):
             active = response_json['result'].get('active')
             if active:
                 self._ismesh = True
@@ -415,7 +926,9 @@ class IPTimeAPI(DeviceScanner):
         return False
 
     async def login(self):
-        """Login Function"""
+        """Login Function
+        # 2026.10.18. 공유기가 응답하지 않으면 False(로그인 거부)와 구분하여 None을 돌려줍니다.
+        """
         url = self._url + LOGIN_URN
         data = {
             "username": self._user_id,
@@ -424,15 +937,17 @@ class IPTimeAPI(DeviceScanner):
         response = None
 
         try:
-            response = await self.loop.run_in_executor(None, lambda: requests.post(url, headers=self.headers, data=data, timeout=TIME_OUT))
+            response = await self._session.post(url, headers=self.headers, data=data, timeout=TIME_OUT, endpoint="login")
+        except TRANSPORT_ERRORS:
+            _LOGGER.debug(f"{self._url}: Login request failed, the router did not respond.")
+            return None
+
+        try:
             #_LOGGER.info(f"[login_response] {response.text}")
-            # response = await self.session.post(
-            #     url, headers=self.headers, data=data, timeout=TIME_OUT
-            # )
             self.efm_session_id = re.findall(
                 re.compile(r"\w{16}"), response.text
             )[0]
-        except:
+        except Exception:
             if not response:
                 return False
             elif (
@@ -455,7 +970,9 @@ class IPTimeAPI(DeviceScanner):
             return False
 
     async def m_login(self):
-        """Mobile Login Function"""
+        """Mobile Login Function
+        # 2026.10.18. 공유기가 응답하지 않으면 False(로그인 거부)와 구분하여 None을 돌려줍니다.
+        """
         url = self._url + M_LOGIN_URN
         data = {
             "username": self._user_id,
@@ -464,14 +981,16 @@ class IPTimeAPI(DeviceScanner):
         response = None
 
         try:
-            response = await self.loop.run_in_executor(None, lambda: requests.post(url, headers=self.headers, data=data, timeout=TIME_OUT))
-            # response = await self.session.post(
-            #     url, headers=self.headers, data=data, timeout=TIME_OUT
-            # )
+            response = await self._session.post(url, headers=self.headers, data=data, timeout=TIME_OUT, endpoint="login")
+        except TRANSPORT_ERRORS:
+            _LOGGER.debug(f"{self._url}: M_Login request failed, the router did not respond.")
+            return None
+
+        try:
             self.efm_session_id = re.findall(
                 re.compile(r"\w{16}"), response.text
             )[0]
-        except:
+        except Exception:
             if not response:
                 return False
             if response and self._ismobile:
@@ -515,9 +1034,8 @@ class IPTimeAPI(DeviceScanner):
         self._ismesh = False
         url = self._url + LOGOUT_URN
         try:
-            # await self.session.get(url, headers=self.headers, timeout=TIME_OUT)
-            await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, timeout=TIME_OUT))
-        except:
+            await self._session.get(url, headers=self.headers, timeout=TIME_OUT, endpoint="logout")
+        except Exception:
             pass
 
     async def m_logout(self):
@@ -527,113 +1045,165 @@ class IPTimeAPI(DeviceScanner):
         self._ismesh = False
         url = self._url + M_LOGOUT_URN
         try:
-            # await self.session.get(url, headers=self.headers, timeout=TIME_OUT)
-            await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, timeout=TIME_OUT))
-        except:
+            await self._session.get(url, headers=self.headers, timeout=TIME_OUT, endpoint="logout")
+        except Exception:
             return False
 
     async def wlan_check(self):
         """Wlan Check Function"""
         result_dict = {}
-
-        url_2g = self._url + WLAN_2G_URN
-        url_5g = self._url + WLAN_5G_URN
         cookies = {"efm_session_id": self.efm_session_id}
 
-        try:
-            # response_2g = await self.session.get(
-            #     url_2g, headers=self.headers, cookies=cookies, timeout=TIME_OUT
-            # )
-            response_2g = await self.loop.run_in_executor(None, lambda: requests.get(url_2g, headers=self.headers, cookies=cookies, timeout=TIME_OUT))
-            soup = BeautifulSoup(response_2g.text, "html.parser")
-            response_2g_list = soup.find_all("tr")
-            response_2g_dict = self.device_parsing(
-                response_2g_list, band="2.4GHz")
-            result_dict.update(response_2g_dict)
-        except ValueError:
-            _LOGGER.debug(f"Session Value Error(2.4g) > {self._url}")
-            await self.logout()
-            return {"session": False}
-        except KeyError:
-            # _LOGGER.debug(f"Session Key Error(2.4g) > {self._url}")
-            result_dict["session"] = False
-        except:
-            _LOGGER.debug(f"2.4G WLAN Connect Error > {self._url}")
-            await self.logout()
-            return result_dict
+        # 2026.10.18. 2.4G, 5G, MESH 목록을 동시에 요청하고, 결과는 기존 순서대로 처리합니다.
+        # 2026.10.18. 조회 기한(poll_deadline)이 지나면 남은 요청을 취소하고, 응답한 대역의 결과만 사용합니다.
+        responses = await self.gather_deadline(
+            self.get_wlan_station(self._url + WLAN_2G_URN, "2.4GHz", cookies),
+            self.get_wlan_station(self._url + WLAN_5G_URN, "5GHz", cookies),
+            *([self.get_mesh_station()] if self._ismesh else []),
+        )
 
-        try:
-            # response_5g = await self.session.get(
-            #     url_5g, headers=self.headers, cookies=cookies, timeout=TIME_OUT
-            # )
-            response_5g = await self.loop.run_in_executor(None, lambda: requests.get(url_5g, headers=self.headers, cookies=cookies, timeout=TIME_OUT))
-            soup = BeautifulSoup(response_5g.text, "html.parser")
-            response_5g_list = soup.find_all("tr")
-            response_5g_dict = self.device_parsing(
-                response_5g_list, band="5GHz")
-            result_dict.update(response_5g_dict)
-        except ValueError:
-            _LOGGER.debug(f"Session Value Error(5g) > {self._url}")
-            await self.logout()
-            return {"session": False}
-        except KeyError:
-            # _LOGGER.debug(f"Session Key Error(5g) > {self._url}")
-            result_dict["session"] = False
-        except:
-            _LOGGER.debug(f"5G WLAN Connect Error > {self._url}")
-            await self.logout()
-            return result_dict
+        sources = {}
+        for endpoint, band, response in zip(("2.4GHz", "5GHz"), ("2.4g", "5g"), responses):
+            sources[endpoint] = not isinstance(response, BaseException)
+            if isinstance(response, (ValueError, KeyError)):
+                self.metrics.endpoint(endpoint).record_session_loss()
+            if isinstance(response, ValueError):
+                _LOGGER.debug(f"Session Value Error({band}) > {self._url}")
+                await self.logout()
+                return {"session": False}
+            elif isinstance(response, KeyError):
+                # _LOGGER.debug(f"Session Key Error({band}) > {self._url}")
+                result_dict["session"] = False
+            elif isinstance(response, BaseException):
+                # 2026.10.18. 일시적인 네트워크 오류(또는 조회 기한 초과)는 세션을 유지하고, 다른 대역의 결과는 사용합니다.
+                _LOGGER.debug(f"{band.upper()} WLAN Connect Error > {self._url}")
+            else:
+                result_dict.update(response)
 
         if self._ismesh:
-            try:
-                response_mesh_dict = await self.get_mesh_station()
-                result_dict.update(response_mesh_dict)
-            except KeyError:
+            response = responses[2]
+            sources["mesh"] = not isinstance(response, BaseException)
+            if isinstance(response, KeyError) and result_dict.get("session"):
+                # 2026.10.18. 같은 조회에서 대역 목록이 세션을 확인했으므로, 읽을 수 없는 MESH 응답은 세션 끊김이 아닌 MESH 오류로 봅니다.
+                _LOGGER.debug(f"MESH Response Error > {self._url}")
+            elif isinstance(response, KeyError):
+                self.metrics.endpoint("mesh").record_session_loss()
                 # _LOGGER.debug(f"Session Key Error(Mesh) > {self._url}")
                 result_dict["session"] = False
-            except:
-                await self.logout()
-                return result_dict
+            elif isinstance(response, BaseException):
+                _LOGGER.debug(f"MESH Connect Error > {self._url}")
+            else:
+                result_dict.update(response)
 
+        if "session" not in result_dict:
+            # 어느 대역도 응답하지 않았습니다.
+            return {}
+        result_dict["sources"] = sources
         if not result_dict["session"]:
             await self.logout()
         return result_dict
 
+    async def get_wlan_station(self, url, band, cookies):
+        """Fetch and parse one band of the PC UI station page."""
+        response = await self._session.get(url, headers=self.headers, cookies=cookies, timeout=TIME_OUT, endpoint=band)
+        pc = await self.backend(BACKEND_PC)
+        return await self.parse_cached(band, pc.parse_pcinfo_page, response.content, response.encoding, band)
+
+    async def parse_timed(self, endpoint, func, *args):
+        """Run func(*args) in the parse worker and record its duration for the endpoint.
+        # 2026.10.18. 파싱은 IPTimeParseWorker(스레드 / 프로세스 pool)에서 수행하고 결과만 이벤트 루프로 돌려받습니다.
+        """
+        result, seconds = await self._worker.async_run(func, *args)
+        self.metrics.endpoint(endpoint).record_parse(seconds)
+        return result
+
+    async def parse_cached(self, endpoint, func, *args):
+        """Run a station page parser with the fingerprint cache entry of the endpoint.
+        # 2026.10.18. 연결 시간을 제외한 응답 본문이 이전 조회와 같으면 다시 파싱하지 않고, 이전 Station의 연결 시간만 갱신합니다.
+        """
+        previous = self._parsed.get(endpoint) if self._worker.shares_memory else None
+        result_dict, entry = await self.parse_timed(endpoint, func, *args, previous)
+        if entry is not None and entry is previous:
+            self.metrics.endpoint(endpoint).record_cache_hit()
+        if self._worker.shares_memory:
+            self._parsed[endpoint] = entry
+        return result_dict
+
+    async def gather_deadline(self, *coros):
+        """Run the requests of one poll concurrently, like gather(return_exceptions=True).
+        # 2026.10.18. poll_deadline이 지나도 끝나지 않은 요청은 취소하고 TimeoutError로 돌려줍니다.
+        """
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        pending = set()
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=self.poll_deadline)
+            for task in pending:
+                task.cancel()
+            if pending:
+                self.metrics.record_deadline_miss()
+                # 취소된 요청은 transport에서 실패로 세지 않으므로, 응답하지 않은 요청으로 circuit breaker에 기록합니다.
+                for _ in pending:
+                    self.breaker.record_failure()
+                _LOGGER.debug(f"{self._url}: {len(pending)} request(s) cancelled at the poll deadline")
+                await asyncio.wait(pending)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    task.add_done_callback(_consume_result)
+
+        results = []
+        for task in tasks:
+            if task in pending or task.cancelled():
+                # 취소 중에 다른 예외로 끝난 요청도 시간 초과로 봅니다.
+                _consume_result(task)
+                results.append(asyncio.TimeoutError("poll deadline"))
+            elif task.exception() is not None:
+                results.append(task.exception())
+            else:
+                results.append(task.result())
+        return results
+
     async def beta_ui_wlan_check(self):
         """Wlan Check Function for Beta UI
         # 2024.05.07. Beta UI 지원 (/)
+        # 2026.10.18. 단말 목록, MESH 활성화 상태, (만료 전) 세션 갱신을 한 번의 batch 요청으로 보냅니다.
         """
-        url = self._url + BETA_SERVICE_URN
-        cookies = {"efm_session_id": self.efm_session_id}
-        data = {
-            "method":"network/interface/lan/stations"
-        }
-        try:
-            response = await self.loop.run_in_executor(None, lambda: requests.post(url, headers=self.json_headers, json=data, cookies=cookies, timeout=TIME_OUT))
-            response_json = response.json()
-        except:
+        methods = [BETA_STATIONS_METHOD, BETA_MESH_METHOD]
+        refresh = self._session_manager.needs_refresh()
+        if refresh:
+            methods.append(BETA_SESSION_UPDATE_METHOD)
+        ismesh = self._ismesh
+        responses = await self.gather_deadline(
+            self.beta_ui_call(methods),
+            *([self.get_mesh_station()] if ismesh else []),
+        )
+        calls = responses[0]
+        if isinstance(calls, BaseException) or not isinstance(calls[0], dict):
             return {"session": False}
+        response_json = calls[0]
 
         result_dict = dict()
-        if response_json['result']:
-            result_dict = self.beta_ui_device_parsing(response_json['result'])
-            if self._ismesh:
-                try:
-                    response_mesh_dict = await self.get_mesh_station()
+        if response_json.get('result'):
+            result_dict = dict(response_json['result'])
+            self.beta_ui_update_mesh(calls[1])
+            if refresh and isinstance(calls[2], dict) and calls[2].get('result'):
+                self._session_manager.refreshed()
+            sources = {"beta_stations": True}
+            if ismesh:
+                response_mesh_dict = responses[1]
+                # 2026.10.18. MESH 목록이 실패하면 세션을 끊긴 것으로 보지 않고 단말 목록만 사용합니다.
+                sources["mesh"] = not isinstance(response_mesh_dict, BaseException)
+                if sources["mesh"]:
                     result_dict.update(response_mesh_dict)
-                except KeyError:
-                    # _LOGGER.debug(f"Session Key Error(Mesh) > {self._url}")
-                    result_dict = {"session": False}
-                    return result_dict
-                except:
-                    result_dict = {"session": False}
-                    return result_dict
             result_dict["session"] = True
+            result_dict["sources"] = sources
         else:
             error_dict = response_json.get('error')
             if error_dict:
                 if error_dict.get('code') == -31998:
                     # Unauthenticated
+                    self.metrics.endpoint("beta_stations").record_session_loss()
                     self.efm_session_id = None
                     result_dict = {"session": False}
                 else:
@@ -644,220 +1214,96 @@ class IPTimeAPI(DeviceScanner):
         #_LOGGER.debug(f"[DevLog-BetaUI-WLAN] {result_dict}")
         return result_dict
 
-    def beta_ui_device_parsing(self, device_list):
-        result_dict = dict()
-        for device in device_list:
-            connect_type = device['connection']['type']
-            if connect_type != 'wireless':
-                continue
-
-            bss = device['connection'][connect_type]['bss']
-            if bss == '5g.1':
-                band = "5GHz"
-            elif bss == '2g.1':
-                band = "2.4GHz"
-            else:
-                band = bss
-
-            rss = device['connection'][connect_type]['rssi']
-            if rss < RSS_LIMIT:
-                state = "not_home"
-            else:
-                state = "home"
-
-            connected_seconds = device['connection'][connect_type]['duration']
-            days = timedelta(seconds=connected_seconds).days
-            (hours, minutes, seconds) = str(timedelta(seconds=connected_seconds)).split(":")
-            connected_time = f"{days}일 {hours}시간 {minutes}분 {seconds}초"
-
-            result_dict[device['mac'].replace(":", "-")] = {
-                "ip": device['info']['ip'],
-                "band": band,
-                "stay_time": connected_time,
-                "rssi": rss,
-                "down_speed": device['connection'][connect_type]['down_speed'],
-                "up_speed": device['connection'][connect_type]['up_speed'],
-                "down_bytes": device['connection'][connect_type]['down_bytes'],
-                "up_bytes": device['connection'][connect_type]['up_bytes'],
-                "state": state
-            }
-        return result_dict
+    def beta_ui_update_mesh(self, response_json):
+        """Follow MESH activation changes reported by easymesh/info."""
+        if not isinstance(response_json, dict) or not isinstance(response_json.get('result'), dict):
+            return
+        active = bool(response_json['result'].get('active'))
+        if active != self._ismesh:
+            _LOGGER.info(f"{self._url}: MESH {'activated' if active else 'deactivated'}")
+            self._ismesh = active
+            self.save_capabilities()
 
     async def m_wlan_check(self):
         """Wlan Check Function"""
         result_dict = {}
-
-        url_2g = self._url + M_WLAN_2G_URN
-        url_5g = self._url + M_WLAN_5G_URN
         cookies = {"efm_session_id": self.efm_session_id}
 
-        try:
-            response_2g = await self.loop.run_in_executor(None, lambda: requests.get(url_2g, headers=self.headers, cookies=cookies, timeout=TIME_OUT))
-            # response_2g = await self.session.get(
-            #     url_2g, headers=self.headers, cookies=cookies, timeout=TIME_OUT
-            # )
-            response_2g_json = loads(response_2g.text)
-            response_2g_dict = self.json_parsing(
-                response_2g_json, band="2.4GHz")
-            result_dict.update(response_2g_dict)
-        except ValueError:
-            _LOGGER.debug(f"Mobile Session Value Error(2.4g) > {self._url}")
-            await self.m_logout()
-            return {"session": False}
-        except KeyError:
-            # 유선공유기일 경우 이곳 KeyError 발생
-            # _LOGGER.debug(f"Mobile Session Key Error(2.4g) > {self._url}")
-            result_dict["session"] = False
-        except:
-            _LOGGER.debug(f"2.4G WLAN Connect Error > {self._url}")
-            await self.m_logout()
-            return result_dict
+        # 2026.10.18. 2.4G, 5G, MESH 목록을 동시에 요청하고, 결과는 기존 순서대로 처리합니다.
+        # 2026.10.18. 조회 기한(poll_deadline)이 지나면 남은 요청을 취소하고, 응답한 대역의 결과만 사용합니다.
+        responses = await self.gather_deadline(
+            self.m_get_wlan_station(self._url + M_WLAN_2G_URN, "2.4GHz", cookies),
+            self.m_get_wlan_station(self._url + M_WLAN_5G_URN, "5GHz", cookies),
+            *([self.get_mesh_station()] if self._ismesh else []),
+        )
 
-        try:
-            response_5g = await self.loop.run_in_executor(None, lambda: requests.get(url_5g, headers=self.headers, cookies=cookies, timeout=TIME_OUT))
-            # response_5g = await self.session.get(
-            #     url_5g, headers=self.headers, cookies=cookies, timeout=TIME_OUT
-            # )
-            response_5g_json = loads(response_5g.text)
-            response_5g_dict = self.json_parsing(response_5g_json, band="5GHz")
-            result_dict.update(response_5g_dict)
-        except ValueError:
-            _LOGGER.debug(f"Mobile Session Value Error(5g) > {self._url}")
-            await self.m_logout()
-            return {"session": False}
-        except KeyError:
-            # 유선공유기일 경우 이곳 KeyError 발생
-            # _LOGGER.debug(f"Mobile Session Key Error(5g) > {self._url}")
-            result_dict["session"] = False
-        except:
-            _LOGGER.debug(f"5G WLAN Connect Error > {self._url}")
-            await self.m_logout()
-            return result_dict
+        sources = {}
+        for endpoint, band, response in zip(("2.4GHz", "5GHz"), ("2.4g", "5g"), responses):
+            sources[endpoint] = not isinstance(response, BaseException)
+            if isinstance(response, (ValueError, KeyError)):
+                self.metrics.endpoint(endpoint).record_session_loss()
+            if isinstance(response, ValueError):
+                _LOGGER.debug(f"Mobile Session Value Error({band}) > {self._url}")
+                await self.m_logout()
+                return {"session": False}
+            elif isinstance(response, KeyError):
+                # 유선공유기일 경우 이곳 KeyError 발생
+                # _LOGGER.debug(f"Mobile Session Key Error({band}) > {self._url}")
+                result_dict["session"] = False
+            elif isinstance(response, BaseException):
+                # 2026.10.18. 일시적인 네트워크 오류(또는 조회 기한 초과)는 세션을 유지하고, 다른 대역의 결과는 사용합니다.
+                _LOGGER.debug(f"{band.upper()} WLAN Connect Error > {self._url}")
+            else:
+                result_dict.update(response)
 
         if self._ismesh:
-            try:
-                response_mesh_dict = await self.get_mesh_station()
-                result_dict.update(response_mesh_dict)
-            except KeyError:
+            response = responses[2]
+            sources["mesh"] = not isinstance(response, BaseException)
+            if isinstance(response, KeyError) and result_dict.get("session"):
+                # 2026.10.18. 같은 조회에서 대역 목록이 세션을 확인했으므로, 읽을 수 없는 MESH 응답은 세션 끊김이 아닌 MESH 오류로 봅니다.
+                _LOGGER.debug(f"MESH Response Error > {self._url}")
+            elif isinstance(response, KeyError):
+                self.metrics.endpoint("mesh").record_session_loss()
                 # _LOGGER.debug(f"Mobile Session Key Error(Mesh) > {self._url}")
                 result_dict["session"] = False
-            except:
-                await self.m_logout()
-                return result_dict
+            elif isinstance(response, BaseException):
+                _LOGGER.debug(f"MESH Connect Error > {self._url}")
+            else:
+                result_dict.update(response)
 
+        if "session" not in result_dict:
+            # 어느 대역도 응답하지 않았습니다.
+            return {}
+        result_dict["sources"] = sources
         if not result_dict["session"]:
             await self.m_logout()
         return result_dict
 
-    async def get_mesh_station(self):
-        from datetime import timedelta
+    async def m_get_wlan_station(self, url, band, cookies):
+        """Fetch and parse one band of the mobile UI station list."""
+        response = await self._session.get(url, headers=self.headers, cookies=cookies, timeout=TIME_OUT, endpoint=band)
+        # 2026.10.18. 응답 bytes를 바로 JSON으로 읽습니다.
+        mobile = await self.backend(BACKEND_MOBILE)
+        return await self.parse_timed(band, mobile.parse_mobile_page, response.content, band)
 
-        result_dict = {}
+    async def get_mesh_station(self):
         url = self._url + MESH_STATION_URN
         cookies = {"efm_session_id": self.efm_session_id}
-        try:
-            response = await self.loop.run_in_executor(None, lambda: requests.get(url, headers=self.headers, cookies=cookies, timeout=TIME_OUT))
-            # response = await self.session.get(
-            #     url, headers=self.headers, cookies=cookies, timeout=TIME_OUT
-            # )
-            device_list = loads(response.text)["station"]
-        except:
-            raise KeyError()
-
-        result_dict["session"] = True
-        for device in device_list:
-            if (
-                "connection" in device
-                and device["connection"] != "Unknown"
-                and device["connection"] != "WIRED"
-            ):
-                if "mac" in device:
-                    connected_seconds = device["timestamp"] - \
-                        device["connected_ts"]
-                    days = timedelta(seconds=connected_seconds).days
-                    (hours, minutes, seconds) = str(
-                        timedelta(seconds=connected_seconds)
-                    ).split(":")
-                    connected_time = f"{days}일 {hours}시간 {minutes}분 {seconds}초"
-                    if "ip" in device:
-                        ip = device["ip"]
-                    else:
-                        ip = "N/A"
-
-                    rss = device.get('rssi')
-                    if rss and rss < RSS_LIMIT:
-                        state = "not_home"
-                    else:
-                        state = "home"
-
-                    bss = device["mode"]
-                    if bss == '5G':
-                        band = "5GHz"
-                    elif bss == '2.4G':
-                        band = "2.4GHz"
-                    else:
-                        band = bss
-
-                    result_dict[device["mac"].replace(":", "-")] = {
-                        "ip": ip,
-                        "band": band,
-                        "stay_time": connected_time,
-                        "rssi": rss,
-                        "state": state,
-                        "down_speed": device.get('down_speed'),
-                        "up_speed": device.get('up_speed'),
-                        "down_bytes": device.get('down_bytes'),
-                        "up_bytes": device.get('up_bytes'),
-                    }
-
+        # 2026.10.18. 연결 오류 / 시간 초과는 그대로 올려 MESH를 응답하지 않은 목록으로만 기록합니다.
+        # KeyError(세션 끊김)는 읽을 수 없는 응답 본문에서만 발생합니다.
+        response = await self._session.get(url, headers=self.headers, cookies=cookies, timeout=TIME_OUT, endpoint="mesh")
+        # 2026.10.18. 이전 조회와 같은 IP / 대역으로 연결된 단말은 Station을 다시 만들지 않고 변하는 값만 갱신합니다.
+        previous = self._mesh_stations if self._worker.shares_memory else {}
+        mesh = await self.backend(BACKEND_MESH)
+        result_dict, self._mesh_topology = await self.parse_timed(
+            "mesh", mesh.parse_mesh_stations, response.content, previous
+        )
+        self._mesh_stations = result_dict
         return result_dict
 
-    def device_parsing(self, response_list, band):
-        result_dict = {}
-        if len(response_list) == 0:
-            raise KeyError()
-
-        for device in response_list:
-            if len(device.find_all("td")) == 4:
-                gray_text = device.find_all("td")[3]
-                if len(gray_text):
-                    ip = re.search(
-                        re.compile(
-                            r"\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}"), gray_text.text
-                    ).group()
-                else:
-                    ip = "N/A"
-                result_dict[device.find_all("td")[0].text] = {
-                    "ip": ip,
-                    "band": band,
-                    "stay_time": device.find_all("td")[2].text,
-                    "state": "home",
-                }
-            else:
-                result_dict["session"] = True
-        return result_dict
 
-    def json_parsing(self, response_json, band):
-        result_dict = {}
-        if "stalist" not in response_json:
-            raise KeyError()
-
-        for device in response_json["stalist"]:
-            if "mac" in device:
-                if device["ipaddr"]:
-                    ip = device["ipaddr"]
-                else:
-                    ip = False
-                connected_time = f"{device['day']}일 {device['hour']}시간 {device['min']}분 {device['sec']}초"
-                result_dict[device["mac"]] = {
-                    "ip": ip,
-                    "band": band,
-                    "stay_time": connected_time,
-                    "state": "home",
-                }
-            else:
-                result_dict["session"] = True
-        return result_dict
+def _or_na(value):
+    return "N/A" if value is None else value
 
 
 class IPTimeSensor:
@@ -868,12 +1314,20 @@ class IPTimeSensor:
         self._state = "N/A"
         self._entity_id = name
         self._target_mac = mac.replace(":", "-")
+        self._mac_key = normalize_mac(mac)
         self._api = api
+        self._station = None
         self.result_dict = {}
         self.error_count = 0
         self.error_threshold = 3
         self.not_home_count = 0
         self.not_home_threshold = 1
+        # 2026.10.18. syslog로 연결 해제가 수신되면 다음 조회에서 바로 not_home 처리
+        self._left = False
+        # 2026.10.18. not_home 확정 대기 중이거나 일시적인 오류일 때는 이전 값을 유지합니다.
+        self._presence = (self._state, False, None, None)
+        # 2026.10.18. 단말이 마지막으로 보인 목록 (2.4GHz, 5GHz, mesh, beta_stations)
+        self._source = None
 
     @property
     def device_id(self):
@@ -896,6 +1350,13 @@ class IPTimeSensor:
         """Return the state of the sensor."""
         return self._state
 
+    @property
+    def presence(self):
+        """Return the attributes that decide whether the tracker changed.
+        Connection time, RSSI and traffic counters change on every poll and are not part of it.
+        """
+        return self._presence
+
     @property
     def state_attributes(self):
         """Return the optional state attributes."""
@@ -904,53 +1365,98 @@ class IPTimeSensor:
         data["mac_address"] = self._target_mac
         data["iptime_url"] = self._api._url
         if self.result_dict:
-            if self._target_mac in self.result_dict:
-                data["stay_time"] = self.result_dict[self._target_mac].get("stay_time", "N/A")
-                data["band"] = self.result_dict[self._target_mac].get("band", "N/A")
-                data["ip"] = self.result_dict[self._target_mac].get("ip", "N/A")
+            station = self._station
+            if station is not None:
+                data["stay_time"] = station.stay_time
+                data["band"] = station.band
+                data["ip"] = station.ip
+                data["hostname"] = _or_na(station.name)
                 # for Beta UI
-                data["rssi"] = self.result_dict[self._target_mac].get("rssi", "N/A")
-                data["up_speed"] = self.result_dict[self._target_mac].get("up_speed", "N/A")
-                data["down_speed"] = self.result_dict[self._target_mac].get("down_speed", "N/A")
-                data["up_bytes"] = self.result_dict[self._target_mac].get("up_bytes", "N/A")
-                data["down_bytes"] = self.result_dict[self._target_mac].get("down_bytes", "N/A")
+                data["rssi"] = _or_na(station.rssi)
+                data["up_speed"] = _or_na(station.up_speed)
+                data["down_speed"] = _or_na(station.down_speed)
+                data["up_bytes"] = _or_na(station.up_bytes)
+                data["down_bytes"] = _or_na(station.down_bytes)
             else:
                 data["stay_time"] = "N/A"
                 data["band"] = "N/A"
                 data["ip"] = "N/A"
+                data["hostname"] = "N/A"
                 # for Beta UI
                 data["rssi"] = "N/A"
                 data["up_speed"] = "N/A"
                 data["down_speed"] = "N/A"
                 data["up_bytes"] = "N/A"
                 data["down_bytes"] = "N/A"
+            # 2026.10.18. 최근 HISTORY_RATE_WINDOW초 동안의 누적 바이트 변화로 계산한 처리량 (bytes/s)
+            # 샘플은 targets의 단말만 보관하므로, track_all로 추가된 단말에는 이 속성이 없습니다.
+            if self._api.history is not None and self._mac_key in self._api.history:
+                down_rate, up_rate = self._api.history.rates(
+                    self._mac_key, time.time() - HISTORY_RATE_WINDOW
+                )
+                data["down_rate"] = _or_na(down_rate)
+                data["up_rate"] = _or_na(up_rate)
         self._state_attributes = data
         return data
 
-    async def async_update(self):
-        """Fetch new state data for the sensor.
-        This is the only method that should fetch new data for Home Assistant.
+    def _source_responded(self):
+        """Return True when the list the station was last seen in was received.
+        A station not seen yet needs every list of the poll.
         """
-        if self._api is None:
-            return
-        await self._api.async_update()
-        self.result_dict = self._api.result
+        sources = self.result_dict.get("sources")
+        if sources is None:
+            return True
+        if self._source is None:
+            return all(sources.values())
+        return sources.get(self._source, True)
+
+    def station_event(self, joined):
+        """Apply an association (joined) or disassociation event from syslog."""
+        if joined:
+            self.not_home_count = 0
+            self._left = False
+            self._state = "home"
+            self._presence = (self._state, True, None, None)
+        else:
+            self._left = True
+
+    def update(self, result_dict, stations):
+        """Update the state from the station table shared by the coordinator.
+        stations is result_dict indexed by normalized MAC address.
+        """
+        self.result_dict = result_dict
+        self._station = stations.get(self._mac_key)
 
         if self.result_dict:
-            if not self.result_dict["session"]:
+            if not self.result_dict.get("session"):
                 return
 
-            self.error_count = 0
-            if self._target_mac in self.result_dict:
+            if self._station is not None:
+                self.error_count = 0
                 self.not_home_count = 0
-                self._state = self.result_dict[self._target_mac].get("state")
+                self._left = False
+                self._state = self._station.state
+                self._presence = (self._state, True, self._station.ip, self._station.band)
+                self._source = self._station.source
+            elif not self._left and not self._source_responded():
+                # 2026.10.18. 단말이 마지막으로 보인 대역(또는 MESH) 목록을 받지 못했으면 이전 상태를 유지합니다.
+                # 같은 목록이 error_threshold회 넘게 실패하면 상태를 알 수 없으므로 N/A로 바꿉니다.
+                if self.error_count < self.error_threshold:
+                    self.error_count += 1
+                else:
+                    self._state = "N/A"
+                    self._presence = (self._state, False, None, None)
+                return
             else:
-                if self.not_home_count < self.not_home_threshold:
+                self.error_count = 0
+                if self.not_home_count < self.not_home_threshold and not self._left:
                     self.not_home_count += 1
                 else:
                     self._state = "not_home"
+                    self._presence = (self._state, True, None, None)
         else:
             if self.error_count < self.error_threshold:
                 self.error_count += 1
             else:
                 self._state = "N/A"
+                self._presence = (self._state, False, None, None)
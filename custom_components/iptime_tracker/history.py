@@ -0,0 +1,175 @@
+"""Bounded per-station sample history of one router.
+
+Samples of the tracked MAC addresses are kept in a columnar ring buffer:
+one float64 column per field, one fixed block of `capacity` rows per MAC.
+With a path the columns live in a memory-mapped file, so the recent history
+survives a restart without going through the recorder database.
+"""
+from array import array
+import math
+import mmap
+import os
+import struct
+
+COLUMNS = ("time", "rssi", "down_speed", "up_speed", "down_bytes", "up_bytes")
+_MAGIC = b"IPTH"
+_VERSION = 1
+# magic, version, slots, capacity
+_HEADER = struct.Struct("<4sIII")
+# mac, rows written
+_SLOT = struct.Struct("<24sQ")
+_NAN = float("nan")
+
+
+def _value(value):
+    return _NAN if value is None else float(value)
+
+
+class IPTimeHistory:
+    """Columnar ring buffer of station samples keyed by tracked MAC."""
+
+    def __init__(self, macs, capacity, path=None):
+        self._macs = list(dict.fromkeys(macs))
+        self._slots = {mac: slot for slot, mac in enumerate(self._macs)}
+        self._capacity = capacity
+        self._path = path
+        self._file = None
+        self._mmap = None
+        self._view = None
+        size = len(self._macs) * capacity
+        if path is None:
+            self._counts = [0] * len(self._macs)
+            self._columns = {name: array("d", bytes(8 * size)) for name in COLUMNS}
+        else:
+            self._open(size)
+
+    def _open(self, size):
+        """Map the history file, reusing it when its layout matches."""
+        slots_size = _SLOT.size * len(self._macs)
+        total = _HEADER.size + slots_size + 8 * size * len(COLUMNS)
+        exists = os.path.exists(self._path)
+        self._file = open(self._path, "r+b" if exists else "w+b")
+        reuse = False
+        if exists and os.path.getsize(self._path) == total:
+            magic, version, slots, capacity = _HEADER.unpack(self._file.read(_HEADER.size))
+            macs = [
+                _SLOT.unpack(self._file.read(_SLOT.size))[0].rstrip(b"\0").decode()
+                for _ in range(slots)
+            ]
+            reuse = (
+                magic == _MAGIC
+                and version == _VERSION
+                and capacity == self._capacity
+                and macs == self._macs
+            )
+        if not reuse:
+            self._file.truncate(0)
+            self._file.truncate(total)
+        self._mmap = mmap.mmap(self._file.fileno(), total)
+        if not reuse:
+            _HEADER.pack_into(self._mmap, 0, _MAGIC, _VERSION, len(self._macs), self._capacity)
+            for slot, mac in enumerate(self._macs):
+                _SLOT.pack_into(self._mmap, _HEADER.size + slot * _SLOT.size, mac.encode(), 0)
+
+        view = self._view = memoryview(self._mmap)
+        self._counts = _MappedCounts(view, _HEADER.size, len(self._macs))
+        offset = _HEADER.size + slots_size
+        self._columns = {}
+        for name in COLUMNS:
+            self._columns[name] = view[offset:offset + 8 * size].cast("d")
+            offset += 8 * size
+
+    def __contains__(self, mac):
+        return mac in self._slots
+
+    def close(self):
+        """Flush and unmap the history file.
+        Afterwards no MAC is tracked: record() ignores samples and rates() returns (None, None).
+        """
+        self._slots = {}
+        if self._mmap is None:
+            return
+        for column in self._columns.values():
+            column.release()
+        self._columns = {}
+        self._counts = None
+        self._view.release()
+        self._view = None
+        self._mmap.flush()
+        self._mmap.close()
+        self._mmap = None
+        self._file.close()
+
+    def record(self, mac, timestamp, station):
+        """Append a sample of a tracked station that reports counters."""
+        slot = self._slots.get(mac)
+        if slot is None:
+            return
+        if station.rssi is None and station.down_bytes is None and station.up_bytes is None:
+            return
+        count = self._counts[slot]
+        row = slot * self._capacity + count % self._capacity
+        columns = self._columns
+        columns["time"][row] = timestamp
+        columns["rssi"][row] = _value(station.rssi)
+        columns["down_speed"][row] = _value(station.down_speed)
+        columns["up_speed"][row] = _value(station.up_speed)
+        columns["down_bytes"][row] = _value(station.down_bytes)
+        columns["up_bytes"][row] = _value(station.up_bytes)
+        self._counts[slot] = count + 1
+
+    def _rows(self, mac, since):
+        """Return the row indexes of a MAC newer than since, oldest first."""
+        slot = self._slots.get(mac)
+        if slot is None:
+            return []
+        count = self._counts[slot]
+        first = max(0, count - self._capacity)
+        base = slot * self._capacity
+        times = self._columns["time"]
+        rows = [base + index % self._capacity for index in range(first, count)]
+        return [row for row in rows if times[row] >= since]
+
+    def samples(self, mac, since):
+        """Return the samples of a MAC newer than since as column lists."""
+        rows = self._rows(mac, since)
+        return {
+            name: [None if math.isnan(value) else value for value in (column[row] for row in rows)]
+            for name, column in self._columns.items()
+        }
+
+    def rates(self, mac, since):
+        """Return (down, up) throughput in bytes per second from counter deltas.
+        Counter resets (reconnects) are skipped instead of counted as negative traffic.
+        """
+        rows = self._rows(mac, since)
+        if len(rows) < 2:
+            return None, None
+        times = self._columns["time"]
+        result = []
+        for name in ("down_bytes", "up_bytes"):
+            column = self._columns[name]
+            total = 0.0
+            elapsed = 0.0
+            for previous, row in zip(rows, rows[1:]):
+                delta = column[row] - column[previous]
+                if delta >= 0:
+                    total += delta
+                    elapsed += times[row] - times[previous]
+            result.append(round(total / elapsed) if elapsed > 0 else None)
+        return tuple(result)
+
+
+class _MappedCounts:
+    """Rows-written counters stored in the slot table of the history file."""
+
+    def __init__(self, view, offset, slots):
+        self._view = view
+        self._offset = offset
+        self._slots = slots
+
+    def __getitem__(self, slot):
+        return struct.unpack_from("<Q", self._view, self._offset + slot * _SLOT.size + 24)[0]
+
+    def __setitem__(self, slot, value):
+        struct.pack_into("<Q", self._view, self._offset + slot * _SLOT.size + 24, value)
@@ -0,0 +1,204 @@
+"""Per-endpoint performance counters for one router."""
+from bisect import bisect_left
+
+from .const import LOOP_LAG_INTERVAL
+
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+LOOP_LAG_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class EndpointStats:
+    """Latency histogram, response size, parse time and error counters."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "session_losses",
+        "bytes",
+        "latency_sum",
+        "latency_max",
+        "last_latency",
+        "parses",
+        "parse_sum",
+        "parse_max",
+        "cache_hits",
+        "buckets",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.session_losses = 0
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.last_latency = None
+        self.parses = 0
+        self.parse_sum = 0.0
+        self.parse_max = 0.0
+        self.cache_hits = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record_request(self, latency, size):
+        self.requests += 1
+        self.bytes += size
+        self.latency_sum += latency
+        self.last_latency = latency
+        if latency > self.latency_max:
+            self.latency_max = latency
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def record_error(self):
+        self.errors += 1
+
+    def record_session_loss(self):
+        self.session_losses += 1
+
+    def record_parse(self, seconds):
+        self.parses += 1
+        self.parse_sum += seconds
+        if seconds > self.parse_max:
+            self.parse_max = seconds
+
+    def record_cache_hit(self):
+        self.cache_hits += 1
+
+    def as_dict(self):
+        histogram = {f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS, self.buckets)}
+        histogram["le_inf"] = self.buckets[-1]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "session_losses": self.session_losses,
+            "bytes": self.bytes,
+            "avg_bytes": round(self.bytes / self.requests) if self.requests else None,
+            "avg_latency_ms": round(self.latency_sum / self.requests * 1000, 2) if self.requests else None,
+            "max_latency_ms": round(self.latency_max * 1000, 2),
+            "last_latency_ms": round(self.last_latency * 1000, 2) if self.last_latency is not None else None,
+            "avg_parse_ms": round(self.parse_sum / self.parses * 1000, 3) if self.parses else None,
+            "max_parse_ms": round(self.parse_max * 1000, 3),
+            "parse_cache_hits": self.cache_hits,
+            "latency_histogram": histogram,
+        }
+
+
+class IPTimeMetrics:
+    """Endpoint statistics of one router, keyed by endpoint name."""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.polls = 0
+        self.poll_sum = 0.0
+        self.last_poll = None
+        self.deadline_misses = 0
+
+    def endpoint(self, name):
+        stats = self.endpoints.get(name)
+        if stats is None:
+            stats = self.endpoints[name] = EndpointStats()
+        return stats
+
+    def record_poll(self, seconds):
+        self.polls += 1
+        self.poll_sum += seconds
+        self.last_poll = seconds
+
+    def record_deadline_miss(self):
+        self.deadline_misses += 1
+
+    def slowest_endpoint(self):
+        """Return the endpoint with the highest average latency, or None."""
+        slowest = None
+        slowest_avg = 0.0
+        for name, stats in self.endpoints.items():
+            if stats.requests and stats.latency_sum / stats.requests > slowest_avg:
+                slowest = name
+                slowest_avg = stats.latency_sum / stats.requests
+        return slowest
+
+    @property
+    def errors(self):
+        return sum(stats.errors for stats in self.endpoints.values())
+
+    @property
+    def session_losses(self):
+        return sum(stats.session_losses for stats in self.endpoints.values())
+
+    def as_dict(self):
+        return {
+            "polls": self.polls,
+            "avg_poll_ms": round(self.poll_sum / self.polls * 1000, 2) if self.polls else None,
+            "last_poll_ms": round(self.last_poll * 1000, 2) if self.last_poll is not None else None,
+            "deadline_misses": self.deadline_misses,
+            "errors": self.errors,
+            "session_losses": self.session_losses,
+            "endpoints": {name: stats.as_dict() for name, stats in sorted(self.endpoints.items())},
+        }
+
+
+class LoopLagMonitor:
+    """Measure how long the event loop was blocked.
+
+    A timer is scheduled every interval; the time it runs past its deadline
+    is time the loop spent in some callback without yielding. The timer only
+    runs between start() and stop(), i.e. while the loop lag sensor exists.
+    """
+
+    def __init__(self, loop, interval=LOOP_LAG_INTERVAL):
+        self._loop = loop
+        self._interval = interval
+        self._handle = None
+        self._expected = None
+        self.samples = 0
+        self.lag_sum = 0.0
+        self.lag_max = 0.0
+        self.last_lag = None
+        self.window_max = 0.0
+        self.buckets = [0] * (len(LOOP_LAG_BUCKETS) + 1)
+
+    @property
+    def running(self):
+        return self._handle is not None
+
+    def start(self):
+        if self._handle is None:
+            self._schedule()
+
+    def stop(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self):
+        self._expected = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._expected, self._tick)
+
+    def _tick(self):
+        lag = max(0.0, self._loop.time() - self._expected)
+        self.samples += 1
+        self.lag_sum += lag
+        self.last_lag = lag
+        if lag > self.lag_max:
+            self.lag_max = lag
+        if lag > self.window_max:
+            self.window_max = lag
+        self.buckets[bisect_left(LOOP_LAG_BUCKETS, lag)] += 1
+        self._schedule()
+
+    def take_window_max(self):
+        """Return the longest lag since the previous call and start a new window."""
+        lag, self.window_max = self.window_max, 0.0
+        return lag
+
+    def as_dict(self):
+        histogram = {f"le_{bound}": count for bound, count in zip(LOOP_LAG_BUCKETS, self.buckets)}
+        histogram["le_inf"] = self.buckets[-1]
+        return {
+            "running": self.running,
+            "samples": self.samples,
+            "avg_lag_ms": round(self.lag_sum / self.samples * 1000, 2) if self.samples else None,
+            "max_lag_ms": round(self.lag_max * 1000, 2),
+            "last_lag_ms": round(self.last_lag * 1000, 2) if self.last_lag is not None else None,
+            "blocked_ms": round(self.lag_sum * 1000, 1),
+            "lag_histogram": histogram,
+        }
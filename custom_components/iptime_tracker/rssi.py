@@ -0,0 +1,112 @@
+"""RSSI smoothing with separate home / not_home thresholds."""
+from array import array
+
+from .const import RSS_ALPHA, RSS_ENTER, RSS_EXIT
+
+# 이 횟수만큼 조회되지 않은 단말의 슬롯은 재사용합니다.
+EXPIRE_POLLS = 60
+
+
+class IPTimeSignalFilter:
+    """Per-MAC RSSI state of one router kept in flat arrays.
+
+    Every station owns a slot: one EWMA value and one home flag. apply()
+    updates all stations of a poll in one pass and sets Station.state from
+    the smoothed value: a station leaves below exit and comes back at or
+    above enter, so a device hovering around the limit no longer flaps every
+    poll. A station starts again from its current value only after a poll in
+    which the list it was last seen in responded without it; a list that did
+    not respond leaves its stations' EWMA untouched. Raw RSSI samples are
+    kept by IPTimeHistory.
+    """
+
+    def __init__(self, alpha=RSS_ALPHA, enter=RSS_ENTER, exit=RSS_EXIT):
+        self._alpha = alpha
+        self._enter = enter
+        self._exit = exit
+        self._limit = (enter + exit) / 2
+        self._slots = {}
+        self._free = []
+        self._smoothed = array("d")
+        self._home = bytearray()
+        self._seen = array("L")
+        self._count = array("L")
+        self._source = []
+        self._poll = 0
+
+    def _slot(self, mac):
+        slot = self._slots.get(mac)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self._home)
+                self._smoothed.append(0.0)
+                self._home.append(0)
+                self._seen.append(0)
+                self._count.append(0)
+                self._source.append(None)
+            self._count[slot] = 0
+            self._slots[mac] = slot
+        return slot
+
+    def apply(self, stations, sources=None):
+        """Smooth the RSSI of every station and set its home / not_home state.
+        sources maps the lists of the poll to whether they responded (None: all did).
+        """
+        self._poll += 1
+        poll = self._poll
+        alpha = self._alpha
+        smoothed_values = self._smoothed
+        home_flags = self._home
+        seen = self._seen
+        counts = self._count
+        station_sources = self._source
+
+        for mac, station in stations.items():
+            rssi = station.rssi
+            if not rssi:
+                continue
+            slot = self._slot(mac)
+            count = counts[slot]
+            if count == 0:
+                # 처음 보이거나 다시 연결된 단말은 현재 값으로 시작합니다.
+                smoothed = float(rssi)
+                home = smoothed >= self._limit
+            else:
+                smoothed = smoothed_values[slot]
+                smoothed += alpha * (rssi - smoothed)
+                home = home_flags[slot]
+                if home and smoothed < self._exit:
+                    home = 0
+                elif not home and smoothed >= self._enter:
+                    home = 1
+            smoothed_values[slot] = smoothed
+            home_flags[slot] = home
+            seen[slot] = poll
+            counts[slot] = count + 1
+            station_sources[slot] = station.source
+            station.state = "home" if home else "not_home"
+
+        # 2026.10.18. 응답한 목록에서 사라진 단말만 연결이 끊긴 것으로 보고, 다시 보이면 현재 값으로 시작합니다.
+        # 응답하지 않은 목록의 단말은 평활화 값을 그대로 유지합니다.
+        for slot in self._slots.values():
+            if counts[slot] and seen[slot] != poll:
+                if sources is None or sources.get(station_sources[slot], True):
+                    counts[slot] = 0
+
+        if poll % EXPIRE_POLLS == 0:
+            self._expire()
+
+    def _expire(self):
+        for mac, slot in list(self._slots.items()):
+            if self._poll - self._seen[slot] > EXPIRE_POLLS:
+                del self._slots[mac]
+                self._free.append(slot)
+
+    def smoothed(self, mac):
+        """Return the smoothed RSSI of a station, or None."""
+        slot = self._slots.get(mac)
+        if slot is None or not self._count[slot]:
+            return None
+        return round(self._smoothed[slot], 1)
@@ -0,0 +1,168 @@
+"""Single scheduler that polls every configured ipTIME router."""
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt
+
+from datetime import timedelta
+import asyncio
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptiveInterval:
+    """Poll interval that follows presence transitions.
+
+    The interval backs off towards max_interval while the station table is
+    stable, and drops to min_interval for a few cycles when a tracked device
+    disappears or its signal gets close to the cut-off.
+    """
+
+    STABLE_CYCLES = 3
+    BACKOFF_FACTOR = 1.5
+    FAST_CYCLES = 3
+
+    def __init__(self, interval, min_interval=None, max_interval=None):
+        self._min = (min_interval or interval).total_seconds()
+        self._max = (max_interval or interval).total_seconds()
+        if self._max < self._min:
+            self._max = self._min
+        self._base = min(max(interval.total_seconds(), self._min), self._max)
+        self._interval = self._base
+        self._stable_cycles = 0
+        self._fast_cycles = 0
+
+    @property
+    def interval(self):
+        return timedelta(seconds=self._interval)
+
+    def update(self, urgent, changed):
+        """Return the delay until the next poll."""
+        if urgent:
+            self._fast_cycles = self.FAST_CYCLES
+            self._stable_cycles = 0
+            self._interval = self._min
+        elif self._fast_cycles:
+            self._fast_cycles -= 1
+            self._interval = self._min
+        elif changed:
+            self._stable_cycles = 0
+            self._interval = self._base
+        else:
+            self._stable_cycles += 1
+            if self._stable_cycles >= self.STABLE_CYCLES:
+                self._interval = min(self._max, max(self._interval, self._base) * self.BACKOFF_FACTOR)
+            else:
+                self._interval = self._base
+        return self.interval
+
+
+class _Job:
+    """One router polled by the scheduler."""
+
+    def __init__(self, name, poll, interval):
+        self.name = name
+        self.poll = poll
+        self.interval = interval
+        self.next_run = None
+        self.task = None
+        self.requested = False
+
+
+class IPTimeScheduler:
+    """Poll many routers from one timer with a global concurrency cap.
+
+    Routers start staggered over the shortest interval so that their polls
+    do not line up, and each router keeps its own interval afterwards.
+    A poll may return a timedelta to override the delay until its next run.
+    """
+
+    def __init__(self, hass, max_concurrency, stagger=None):
+        self._hass = hass
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._stagger = stagger
+        self._jobs = []
+        self._unsub = None
+
+    @property
+    def semaphore(self):
+        """Concurrency cap shared with router work outside the polls, e.g. background logins."""
+        return self._semaphore
+
+    def add(self, name, poll, interval):
+        """Register a router poll coroutine function."""
+        self._jobs.append(_Job(name, poll, interval))
+
+    @callback
+    def async_start(self):
+        """Schedule the first poll of every router."""
+        if not self._jobs:
+            return
+        stagger = self._stagger
+        if stagger is None:
+            stagger = min(job.interval for job in self._jobs) / len(self._jobs)
+        now = dt.utcnow()
+        for index, job in enumerate(self._jobs):
+            job.next_run = now + stagger * index
+        self._async_schedule()
+
+    @callback
+    def async_stop(self):
+        """Stop scheduling polls."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        jobs, self._jobs = self._jobs, []
+        for job in jobs:
+            if job.task:
+                job.task.cancel()
+
+    @callback
+    def async_request(self, name):
+        """Poll the router as soon as possible, e.g. after a syslog event."""
+        for job in self._jobs:
+            if job.name != name or job.next_run is None:
+                continue
+            if job.task is not None:
+                # 조회 중이면 끝난 직후에 한 번 더 조회합니다.
+                job.requested = True
+            else:
+                job.next_run = dt.utcnow()
+                self._async_schedule()
+
+    @callback
+    def _async_schedule(self):
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        pending = [job.next_run for job in self._jobs if job.task is None]
+        if pending and not self._hass.is_stopping:
+            self._unsub = async_track_point_in_utc_time(
+                self._hass, self._async_tick, min(pending)
+            )
+
+    @callback
+    def _async_tick(self, now):
+        self._unsub = None
+        now = dt.utcnow()
+        for job in self._jobs:
+            if job.task is None and job.next_run <= now:
+                job.task = self._hass.async_create_task(self._async_run(job))
+        self._async_schedule()
+
+    async def _async_run(self, job):
+        delay = None
+        try:
+            async with self._semaphore:
+                delay = await job.poll()
+        except Exception:
+            _LOGGER.exception(f"{job.name}: Unexpected error while polling")
+        finally:
+            # 시작 시점 기준으로 다음 실행 시간을 정해 stagger 간격을 유지합니다.
+            job.next_run = max(job.next_run + (delay or job.interval), dt.utcnow())
+            if job.requested:
+                job.requested = False
+                job.next_run = dt.utcnow()
+            job.task = None
+            if job in self._jobs:
+                self._async_schedule()
@@ -0,0 +1,98 @@
+"""Optional performance sensors for ipTIME Tracker."""
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import UnitOfTime
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+SENSOR_TYPES = {
+    "poll_latency": ("Poll Latency", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT),
+    "errors": ("Errors", None, SensorStateClass.TOTAL_INCREASING),
+    "session_losses": ("Session Losses", None, SensorStateClass.TOTAL_INCREASING),
+}
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the metric sensors of the routers handed over by device_tracker."""
+    if discovery_info is None:
+        return
+    domain_data = hass.data[DOMAIN]
+    apis = domain_data["apis"]
+    entities = [
+        IPTimeMetricSensor(apis[url], sensor_type)
+        for url in discovery_info["urls"]
+        for sensor_type in SENSOR_TYPES
+    ]
+    # 2026.10.18. 이벤트 루프 지연 센서는 공유기 수와 관계없이 하나만 만듭니다.
+    if not domain_data.get("loop_lag_sensor"):
+        domain_data["loop_lag_sensor"] = True
+        entities.append(IPTimeLoopLagSensor(domain_data["loop_monitor"]))
+    async_add_entities(entities, True)
+
+
+class IPTimeMetricSensor(SensorEntity):
+    """Poll latency, error and session loss counters of one router.
+
+    The full per-endpoint metrics are only returned by the diagnostics
+    service; the sensors keep a few scalar attributes out of the recorder.
+    """
+
+    _unrecorded_attributes = frozenset({"avg_poll_ms", "polls", "slowest_endpoint"})
+
+    def __init__(self, api, sensor_type):
+        name, unit, state_class = SENSOR_TYPES[sensor_type]
+        self._api = api
+        self._sensor_type = sensor_type
+        self._attr_name = f"iptime {api._url.split('://')[-1]} {name}"
+        self._attr_unique_id = f"{slugify(api._url)}_{sensor_type}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+
+    async def async_update(self):
+        metrics = self._api.metrics
+        if self._sensor_type == "poll_latency":
+            if metrics.last_poll is not None:
+                self._attr_native_value = round(metrics.last_poll * 1000, 1)
+            # 2026.10.18. 엔드포인트별 히스토그램은 diagnostics 서비스에서만 제공합니다. (recorder 기록량 감소)
+            self._attr_extra_state_attributes = {
+                "polls": metrics.polls,
+                "avg_poll_ms": round(metrics.poll_sum / metrics.polls * 1000, 1) if metrics.polls else None,
+                "slowest_endpoint": metrics.slowest_endpoint(),
+            }
+        elif self._sensor_type == "errors":
+            self._attr_native_value = metrics.errors
+        else:
+            self._attr_native_value = metrics.session_losses
+
+
+class IPTimeLoopLagSensor(SensorEntity):
+    """Longest event loop stall since the previous update.
+
+    The monitor timer runs only while this sensor is added to Home Assistant,
+    so the loop is not woken up when no metrics sensor is enabled.
+    """
+
+    _attr_name = "iptime Event Loop Lag"
+    _attr_unique_id = f"{DOMAIN}_event_loop_lag"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"avg_lag_ms", "max_lag_ms", "samples"})
+
+    def __init__(self, monitor):
+        self._monitor = monitor
+
+    async def async_added_to_hass(self):
+        self._monitor.start()
+
+    async def async_will_remove_from_hass(self):
+        self._monitor.stop()
+
+    async def async_update(self):
+        monitor = self._monitor
+        if monitor.samples:
+            self._attr_native_value = round(monitor.take_window_max() * 1000, 1)
+        self._attr_extra_state_attributes = {
+            "samples": monitor.samples,
+            "avg_lag_ms": round(monitor.lag_sum / monitor.samples * 1000, 2) if monitor.samples else None,
+            "max_lag_ms": round(monitor.lag_max * 1000, 2),
+        }
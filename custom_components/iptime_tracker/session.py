@@ -0,0 +1,57 @@
+"""Login session lifecycle for one ipTIME router."""
+import random
+import time
+
+from .const import SESSION_REFRESH_INTERVAL, LOGIN_BACKOFF_BASE, LOGIN_BACKOFF_MAX
+
+
+class IPTimeSessionManager:
+    """Decide when to refresh the session and when a new login is allowed.
+
+    ipTIME routers lock the admin account when logins come too often, so
+    failed logins are retried with exponential backoff and equal jitter:
+    the delay is drawn between half and all of the backoff, so a login is
+    never retried sooner than half the backoff.
+    """
+
+    def __init__(
+        self,
+        refresh_interval=SESSION_REFRESH_INTERVAL,
+        backoff_base=LOGIN_BACKOFF_BASE,
+        backoff_max=LOGIN_BACKOFF_MAX,
+    ):
+        self._refresh_interval = refresh_interval
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._last_refresh = 0.0
+        self._next_login = 0.0
+        self.login_failures = 0
+
+    def can_login(self):
+        """Return True when the backoff delay after the last failure has passed."""
+        return time.monotonic() >= self._next_login
+
+    def login_succeeded(self):
+        self.login_failures = 0
+        self._next_login = 0.0
+        self._last_refresh = time.monotonic()
+
+    def login_failed(self):
+        """Record a failed login and return the delay before the next attempt."""
+        self.login_failures += 1
+        delay = min(self._backoff_max, self._backoff_base * 2 ** (self.login_failures - 1))
+        # equal jitter: delay / 2 ~ delay
+        delay = random.uniform(delay / 2, delay)
+        self._next_login = time.monotonic() + delay
+        return delay
+
+    def reset_backoff(self):
+        """Allow a login right away, e.g. once an unreachable router answers again."""
+        self._next_login = 0.0
+
+    def needs_refresh(self):
+        """Return True when the session should be refreshed before it expires."""
+        return time.monotonic() - self._last_refresh >= self._refresh_interval
+
+    def refreshed(self):
+        self._last_refresh = time.monotonic()
@@ -0,0 +1,83 @@
+"""Compact station record shared by the parsers."""
+
+
+def format_stay_time(seconds):
+    """Format connected seconds the way the ipTIME UI shows them."""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    return f"{days}일 {hours}시간 {minutes:02}분 {seconds:02}초"
+
+
+class Station:
+    """One associated station.
+
+    Numbers are kept as the router sent them; stay_time is only formatted
+    when the tracker attributes are read. stay holds the connected seconds,
+    or the text of the PC UI page which is already formatted. source names
+    the list the station came from (2.4GHz, 5GHz, mesh or beta_stations).
+    """
+
+    __slots__ = (
+        "ip",
+        "band",
+        "stay",
+        "rssi",
+        "down_speed",
+        "up_speed",
+        "down_bytes",
+        "up_bytes",
+        "state",
+        "name",
+        "source",
+    )
+
+    def __init__(
+        self,
+        ip,
+        band,
+        stay,
+        rssi=None,
+        down_speed=None,
+        up_speed=None,
+        down_bytes=None,
+        up_bytes=None,
+        state="home",
+        name=None,
+        source=None,
+    ):
+        self.ip = ip
+        self.band = band
+        self.stay = stay
+        self.rssi = rssi
+        self.down_speed = down_speed
+        self.up_speed = up_speed
+        self.down_bytes = down_bytes
+        self.up_bytes = up_bytes
+        self.state = state
+        self.name = name
+        self.source = source
+
+    @property
+    def stay_time(self):
+        if isinstance(self.stay, str):
+            return self.stay
+        return format_stay_time(self.stay)
+
+    def as_dict(self):
+        return {
+            "ip": self.ip,
+            "band": self.band,
+            "stay_time": self.stay_time,
+            "rssi": self.rssi,
+            "down_speed": self.down_speed,
+            "up_speed": self.up_speed,
+            "down_bytes": self.down_bytes,
+            "up_bytes": self.up_bytes,
+            "state": self.state,
+            "name": self.name,
+            "source": self.source,
+        }
+
+    def __repr__(self):
+        return f"Station({self.as_dict()!r})"
@@ -0,0 +1,100 @@
+"""UDP syslog receiver for ipTIME wireless association events.
+
+ipTIME routers can forward their system log to a remote syslog server.
+Only the wireless driver's association / disassociation messages are
+handed to the coordinator of the router they came from; other lines that
+carry a MAC address (DHCP leases, admin logins, ...) are ignored. One
+listener is shared by every platform entry using the same port.
+"""
+from homeassistant.core import callback
+
+import asyncio
+import logging
+import re
+import socket
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAC = r"(?<![0-9A-Fa-f])[0-9A-Fa-f]{2}(?:[:-][0-9A-Fa-f]{2}){5}(?![0-9A-Fa-f])"
+_WIRELESS = r"무선\s*(?:단말\s*)?(?:연결|접속)(?P<leave>\s*(?:해제|끊))?"
+# 2026.10.18. 무선 드라이버의 연결 / 해제 메시지 형식에만 맞춥니다. leave 그룹이 있으면 해제입니다.
+_EVENT_RES = (
+    # hostapd: AP-STA-CONNECTED aa:bb:cc:dd:ee:ff
+    re.compile(rf"AP-STA-(?:CONNECTED|(?P<leave>DISCONNECTED)) (?P<mac>{_MAC})"),
+    # hostapd: STA aa:bb:cc:dd:ee:ff IEEE 802.11: disassociated
+    re.compile(
+        rf"STA (?P<mac>{_MAC}) IEEE 802\.11: "
+        r"(?:(?:re)?associated|(?P<leave>disassociated|deauthenticated))\b"
+    ),
+    # ipTIME 시스템 로그: [5G] 무선 연결 : AA-BB-CC-DD-EE-FF / AA-BB-CC-DD-EE-FF 무선 연결 해제
+    re.compile(rf"{_WIRELESS}\W*(?P<mac>{_MAC})"),
+    re.compile(rf"(?P<mac>{_MAC})\W*{_WIRELESS}"),
+)
+
+
+def parse_station_event(data):
+    """Return (mac, joined) for a wireless association log line, otherwise None."""
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("euc-kr", errors="replace")
+    for pattern in _EVENT_RES:
+        match = pattern.search(text)
+        if match is not None:
+            return match["mac"], match["leave"] is None
+    return None
+
+
+class _SyslogProtocol(asyncio.DatagramProtocol):
+    def __init__(self, listener):
+        self._listener = listener
+
+    def datagram_received(self, data, addr):
+        event = parse_station_event(data)
+        if event is not None:
+            self._listener.async_station_event(addr[0], *event)
+
+    def error_received(self, exc):
+        _LOGGER.debug(f"Syslog receive error: {exc}")
+
+
+class IPTimeSyslogListener:
+    """Receive syslog datagrams and route station events by router address."""
+
+    def __init__(self, hass, port, host="0.0.0.0"):
+        self._hass = hass
+        self._host = host
+        self._port = port
+        self._routes = {}
+        self._transport = None
+
+    async def async_start(self):
+        """Bind the UDP socket. Raises OSError when the port is unavailable."""
+        self._transport, _ = await self._hass.loop.create_datagram_endpoint(
+            lambda: _SyslogProtocol(self), local_addr=(self._host, self._port)
+        )
+        _LOGGER.info(f"Listening for ipTIME syslog on {self._host}:{self._port}/udp")
+
+    async def async_add_router(self, host, coordinator):
+        """Route the events sent from host to the router's coordinator."""
+        try:
+            infos = await self._hass.loop.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+        except OSError as err:
+            _LOGGER.warning(f"{host}: Cannot resolve router address for syslog ({err})")
+            return
+        for info in infos:
+            self._routes[info[4][0]] = coordinator
+
+    @callback
+    def async_station_event(self, source, mac, joined):
+        coordinator = self._routes.get(source)
+        if coordinator is None:
+            _LOGGER.debug(f"Syslog event from unknown router {source} ignored")
+            return
+        self._hass.async_create_task(coordinator.async_station_event(mac, joined))
+
+    @callback
+    def async_stop(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
@@ -0,0 +1,349 @@
+"""Asyncio HTTP transport for ipTIME routers.
+
+aiohttp 버전이 업데이트 되면서 ipTIME 공유기가 보내는 비정상적인 HTTP Header를 읽을 수 없게 되어
+그동안 requests를 executor에서 실행하였습니다. 이 모듈은 헤더를 관대하게 해석하는
+HTTP/1.1 클라이언트로, 공유기마다 keep-alive 연결을 재사용합니다.
+"""
+import asyncio
+import gzip
+import json
+import logging
+import ssl
+import time
+import zlib
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from .decode import decode_text, loads
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_IDLE_CONNECTIONS = 4
+MAX_REDIRECTS = 5
+MAX_HEADER_LINES = 100
+# 응답을 받지 못하고 끊긴 재사용 연결에서 새 연결로 다시 보내도 되는 요청
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+class TransportError(OSError):
+    """Raised when the router closes the connection or sends garbage."""
+
+
+class RouterUnavailable(TransportError):
+    """Raised without sending the request while the circuit breaker is open."""
+
+
+# 공유기가 응답하지 않은 경우 (연결 실패, 시간 초과, 응답 도중 연결 끊김)
+TRANSPORT_ERRORS = (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError)
+
+
+class IPTimeResponse:
+    """Minimal response object mirroring the parts of requests.Response we use."""
+
+    def __init__(self, url, status, headers, cookies, content):
+        self.url = url
+        self.status_code = status
+        self.headers = headers
+        self.cookies = cookies
+        self.content = content
+        self._text = None
+
+    @property
+    def encoding(self):
+        content_type = self.headers.get("content-type", "")
+        for param in content_type.split(";")[1:]:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "charset" and value:
+                return value.strip("\"' ")
+        return None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._text = decode_text(self.content, self.encoding)
+        return self._text
+
+    def json(self):
+        return loads(self.content)
+
+
+class _Connection:
+    """One keep-alive connection to the router."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def alive(self):
+        """False when the router has already closed the idle connection."""
+        return not (self.writer.is_closing() or self.reader.at_eof())
+
+    def close(self):
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class IPTimeTransport:
+    """Pooled keep-alive HTTP client for a single router."""
+
+    def __init__(self, base_url, max_idle=MAX_IDLE_CONNECTIONS, metrics=None, breaker=None):
+        parts = urlsplit(base_url)
+        self._scheme = parts.scheme or "http"
+        self._host = parts.hostname
+        self._port = parts.port or (443 if self._scheme == "https" else 80)
+        if parts.port and parts.port not in (80, 443):
+            self._host_header = f"{self._host}:{parts.port}"
+        else:
+            self._host_header = self._host
+        self._ssl = None
+        if self._scheme == "https":
+            # 공유기 관리페이지는 자체 서명 인증서를 사용합니다.
+            # 검증하지 않으므로 CA 인증서를 읽지 않는 context를 만듭니다. (이벤트 루프에서 파일 읽기 방지)
+            self._ssl = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            self._ssl.check_hostname = False
+            self._ssl.verify_mode = ssl.CERT_NONE
+        self._max_idle = max_idle
+        self._idle = []
+        self._closed = False
+        self.metrics = metrics
+        self.breaker = breaker
+
+    async def get(self, url, headers=None, cookies=None, timeout=None, endpoint=None):
+        return await self.request(
+            "GET", url, headers=headers, cookies=cookies, timeout=timeout, endpoint=endpoint
+        )
+
+    async def post(self, url, headers=None, cookies=None, data=None, json=None, timeout=None, endpoint=None):
+        return await self.request(
+            "POST", url, headers=headers, cookies=cookies, data=data, json=json, timeout=timeout, endpoint=endpoint
+        )
+
+    async def request(
+        self, method, url, headers=None, cookies=None, data=None, json=None, timeout=None, endpoint=None
+    ):
+        """Send a request, following redirects on the same router.
+        endpoint names the request in the metrics; the URL path is used when omitted.
+        Raises RouterUnavailable at once while the circuit breaker is open,
+        and TransportError once the transport is closed.
+        """
+        if self._closed:
+            raise TransportError(f"Transport to {self._host} is closed")
+        breaker = self.breaker
+        if breaker is not None and not breaker.allow_request():
+            raise RouterUnavailable(f"{self._host} is not responding")
+        body = _encode_body(data, json)
+        coro = self._request(method, url, headers or {}, cookies, body)
+        if timeout is not None:
+            coro = asyncio.wait_for(coro, timeout)
+        stats = None
+        if self.metrics is not None:
+            stats = self.metrics.endpoint(endpoint or urlsplit(url).path)
+        start = time.perf_counter()
+        try:
+            response = await coro
+        except BaseException as err:
+            if stats is not None:
+                stats.record_error()
+            # 연결 실패, 시간 초과처럼 공유기가 응답하지 않은 경우만 실패로 셉니다.
+            if breaker is not None and isinstance(err, TRANSPORT_ERRORS):
+                breaker.record_failure()
+            raise
+        if stats is not None:
+            stats.record_request(time.perf_counter() - start, len(response.content))
+        if breaker is not None:
+            breaker.record_success()
+        return response
+
+    async def close(self):
+        """Close every pooled connection and refuse new requests."""
+        self._closed = True
+        self._close_idle()
+
+    def _close_idle(self):
+        while self._idle:
+            self._idle.pop().close()
+
+    def _pop_idle(self):
+        """Return a pooled connection the router has not closed yet, or None."""
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.alive:
+                return connection
+            connection.close()
+        return None
+
+    async def _request(self, method, url, headers, cookies, body):
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self._send(method, url, headers, cookies, body)
+            location = response.headers.get("location")
+            if response.status_code not in (301, 302, 303, 307, 308) or not location:
+                return response
+            target = urljoin(url, location)
+            parts = urlsplit(target)
+            if parts.hostname != self._host or (parts.port or self._port) != self._port:
+                return response
+            if response.status_code in (301, 302, 303) and method != "GET":
+                method = "GET"
+                body = None
+            url = target
+        return response
+
+    async def _send(self, method, url, headers, cookies, body):
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        request = self._build_request(method, path, headers, cookies, body)
+
+        # 재사용한 연결이 응답의 첫 바이트 전에 끊기면 멱등 요청(GET)만 새 연결로 한 번 더 보냅니다.
+        # 공유기가 이미 처리했을 수 있는 로그인, JSON-RPC 같은 POST는 다시 보내지 않고,
+        # 대신 공유기가 닫은 유휴 연결은 보내기 전에 걸러냅니다.
+        for attempt in range(2):
+            connection = self._pop_idle() if attempt == 0 else None
+            reused = connection is not None
+            if connection is None:
+                connection = await self._connect()
+            try:
+                try:
+                    connection.writer.write(request)
+                    await connection.writer.drain()
+                    status_line = await connection.reader.readline()
+                    if not status_line:
+                        raise TransportError("Connection closed by router")
+                except OSError:
+                    if reused:
+                        # 공유기가 유휴 연결을 정리한 경우 나머지 유휴 연결도 끊겨 있으므로 모두 닫습니다.
+                        self._close_idle()
+                        if method in IDEMPOTENT_METHODS:
+                            connection.close()
+                            continue
+                    raise
+                response, keep_alive = await self._read_response(connection.reader, status_line, method, url)
+            except BaseException:
+                connection.close()
+                raise
+            if keep_alive and not self._closed and len(self._idle) < self._max_idle:
+                self._idle.append(connection)
+            else:
+                connection.close()
+            return response
+
+    async def _connect(self):
+        if self._closed:
+            # 닫은 뒤에 끝나는 요청(redirect, 재시도)이 새 연결을 만들지 않도록 합니다.
+            raise TransportError(f"Transport to {self._host} is closed")
+        reader, writer = await asyncio.open_connection(
+            self._host, self._port, ssl=self._ssl, limit=2 ** 20
+        )
+        return _Connection(reader, writer)
+
+    def _build_request(self, method, path, headers, cookies, body):
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self._host_header}"]
+        names = set()
+        for name, value in headers.items():
+            names.add(name.lower())
+            lines.append(f"{name}: {value}")
+        if cookies:
+            lines.append("Cookie: " + "; ".join(f"{k}={v}" for k, v in cookies.items() if v is not None))
+        if body is not None:
+            content, content_type = body
+            if "content-type" not in names:
+                lines.append(f"Content-Type: {content_type}")
+            lines.append(f"Content-Length: {len(content)}")
+        lines.append("Connection: keep-alive")
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1", errors="replace")
+        return head + body[0] if body is not None else head
+
+    async def _read_response(self, reader, status_line, method, url):
+        status_parts = status_line.decode("latin-1").split(None, 2)
+        if len(status_parts) < 2 or not status_parts[0].upper().startswith("HTTP/"):
+            raise TransportError(f"Invalid status line: {status_line!r}")
+        version = status_parts[0].upper()
+        try:
+            status = int(status_parts[1])
+        except ValueError as err:
+            raise TransportError(f"Invalid status code: {status_line!r}") from err
+
+        headers = {}
+        cookies = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = await reader.readline()
+            if not line or line in (b"\r\n", b"\n"):
+                break
+            # ipTIME 헤더는 공백, 중복, 잘못된 줄바꿈이 섞여 있으므로 해석 가능한 줄만 사용합니다.
+            name, sep, value = line.decode("latin-1").partition(":")
+            if not sep:
+                continue
+            name = name.strip().lower()
+            value = value.strip()
+            if name == "set-cookie":
+                cookie_name, _, cookie_value = value.split(";", 1)[0].partition("=")
+                if cookie_name.strip():
+                    cookies[cookie_name.strip()] = cookie_value.strip()
+            headers[name] = value
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = "close" not in connection and (version != "HTTP/1.0" or "keep-alive" in connection)
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            content = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            content = await _read_chunked(reader)
+        elif headers.get("content-length", "").strip().isdigit():
+            content = await reader.readexactly(int(headers["content-length"].strip()))
+        else:
+            content = await reader.read()
+            keep_alive = False
+
+        # 압축을 풀 수 없는 본문은 로그인 페이지로 오인하지 않도록 응답하지 않은 요청으로 처리합니다.
+        encoding = headers.get("content-encoding", "").lower()
+        if content and "gzip" in encoding:
+            try:
+                content = gzip.decompress(content)
+            except (OSError, EOFError, zlib.error) as err:
+                raise TransportError(f"{url}: gzip decoding failed ({err})") from err
+        elif content and "deflate" in encoding:
+            try:
+                content = zlib.decompress(content)
+            except zlib.error:
+                try:
+                    content = zlib.decompress(content, -zlib.MAX_WBITS)
+                except zlib.error as err:
+                    raise TransportError(f"{url}: deflate decoding failed ({err})") from err
+
+        return IPTimeResponse(url, status, headers, cookies, content), keep_alive
+
+
+async def _read_chunked(reader):
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise TransportError("Connection closed inside chunked body")
+        try:
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        except ValueError as err:
+            raise TransportError(f"Invalid chunk size: {size_line!r}") from err
+        if size == 0:
+            # trailer
+            while True:
+                line = await reader.readline()
+                if not line or line in (b"\r\n", b"\n"):
+                    break
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
+
+
+def _encode_body(data, json_data):
+    if json_data is not None:
+        return json.dumps(json_data).encode("utf-8"), "application/json"
+    if data is None:
+        return None
+    if isinstance(data, dict):
+        return urlencode(data).encode("utf-8"), "application/x-www-form-urlencoded"
+    if isinstance(data, str):
+        return data.encode("utf-8"), "text/plain"
+    return bytes(data), "application/octet-stream"
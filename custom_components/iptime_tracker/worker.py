@@ -0,0 +1,72 @@
+"""Run the response parsers off the Home Assistant event loop.
+
+The transport already awaits the router without blocking, so only the
+decoding and parsing of the response bodies is handed to the worker. The
+parsers in backends/ are plain module-level functions and return compact
+Station tables, which also makes them usable from a process pool.
+"""
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor
+import asyncio
+import logging
+import time
+
+from .const import PARSE_MODE_LOOP, PARSE_MODE_PROCESS, PARSE_WORKERS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _timed(func, *args):
+    """Call func in the worker and return (result, seconds spent)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class IPTimeParseWorker:
+    """Thread or process pool shared by the routers for response parsing.
+
+    In loop mode the parsers run inline on the event loop, as before.
+    """
+
+    def __init__(self, mode=PARSE_MODE_LOOP, workers=PARSE_WORKERS):
+        self.mode = mode
+        self._workers = workers
+        self._executor = None
+        if mode != PARSE_MODE_LOOP:
+            self._executor = self._create_executor()
+
+    def _create_executor(self):
+        if self.mode == PARSE_MODE_PROCESS:
+            # process pool을 사용할 때만 multiprocessing을 불러옵니다.
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+
+            # fork은 Home Assistant의 스레드 / 이벤트 루프 상태까지 복제하므로 spawn으로 시작합니다.
+            return ProcessPoolExecutor(self._workers, mp_context=multiprocessing.get_context("spawn"))
+        return ThreadPoolExecutor(self._workers, thread_name_prefix="iptime_parse")
+
+    @property
+    def shares_memory(self):
+        """True when parse results are the same objects the worker built.
+        Reuse state such as the previous MESH stations is only worth passing then.
+        """
+        return self.mode != PARSE_MODE_PROCESS
+
+    async def async_run(self, func, *args):
+        """Run func(*args) in the worker and return (result, seconds spent)."""
+        if self._executor is None:
+            return _timed(func, *args)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, _timed, func, *args)
+        except BrokenExecutor:
+            # 작업 프로세스가 종료된 경우 pool을 새로 만들고 한 번 더 시도합니다.
+            _LOGGER.warning(f"Parse worker ({self.mode}) stopped unexpectedly, restarting it")
+            self._executor.shutdown(wait=False)
+            self._executor = self._create_executor()
+            return await loop.run_in_executor(self._executor, _timed, func, *args)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,45 @@
+"""Matching Beta UI JSON-RPC batch responses to their requests."""
+import json
+
+from benchmarks.fake_router import FakeRouter, SESSION_ID
+from custom_components.iptime_tracker.backends.beta_ui import parse_beta_batch
+from custom_components.iptime_tracker.const import BETA_MESH_METHOD, BETA_STATIONS_METHOD
+from custom_components.iptime_tracker.station import Station
+
+METHODS = [BETA_STATIONS_METHOD, BETA_MESH_METHOD]
+
+
+def stations_result():
+    router = FakeRouter("beta_ui", stations=4)
+    request = {"cookies": {"efm_session_id": SESSION_ID}, "body": json.dumps({"method": BETA_STATIONS_METHOD}).encode()}
+    return json.loads(router._beta_service(request)[2])["result"]
+
+
+def batch(*items):
+    return json.dumps(list(items)).encode()
+
+
+def test_matched_by_id_in_any_order():
+    responses, by_id = parse_beta_batch(
+        batch({"id": 1, "result": {"active": True}}, {"id": 0, "result": stations_result()}), METHODS
+    )
+    assert by_id
+    assert all(isinstance(station, Station) for station in responses[0]["result"].values())
+    assert responses[1]["result"] == {"active": True}
+
+
+def test_matched_by_position_without_int_ids():
+    for first, second in ((None, None), ("0", "1")):
+        items = [{"result": stations_result()}, {"result": {"active": False}}]
+        if first is not None:
+            items[0]["id"], items[1]["id"] = first, second
+        responses, by_id = parse_beta_batch(batch(*items), METHODS)
+        assert not by_id
+        assert responses[0]["result"]
+        assert responses[1]["result"] == {"active": False}
+
+
+def test_unmatched_reply():
+    assert parse_beta_batch(b'{"result": null, "error": {"code": -32600}}', METHODS) == (None, False)
+    assert parse_beta_batch(batch({"id": 0, "result": []}), METHODS) == (None, False)
+    assert parse_beta_batch(batch({"id": 0, "result": []}, "x"), METHODS) == (None, False)
@@ -0,0 +1,32 @@
+"""Mobile UI station list parser."""
+import json
+
+from custom_components.iptime_tracker.backends.mobile import parse_mobile_page
+
+
+def page(*stations):
+    return json.dumps({"stalist": [*stations, {"count": len(stations)}]}).encode()
+
+
+def test_connected_time():
+    result = parse_mobile_page(
+        page({"mac": "02-00-00-00-00-01", "ipaddr": "192.168.0.10", "day": 1, "hour": "2", "min": 3, "sec": "4"}),
+        "5GHz",
+    )
+    assert result["session"] is True
+    station = result["02-00-00-00-00-01"]
+    assert station.stay == 93784
+    assert station.stay_time == "1일 2시간 03분 04초"
+
+
+def test_unexpected_time_fields_are_zero():
+    result = parse_mobile_page(
+        page(
+            {"mac": "02-00-00-00-00-02", "ipaddr": "", "day": "-", "hour": "", "min": None, "sec": "7"},
+            {"mac": "02-00-00-00-00-03", "ipaddr": "192.168.0.11"},
+        ),
+        "2.4GHz",
+    )
+    assert result["02-00-00-00-00-02"].stay == 7
+    assert result["02-00-00-00-00-02"].ip is False
+    assert result["02-00-00-00-00-03"].stay == 0
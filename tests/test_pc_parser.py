@@ -0,0 +1,153 @@
+"""PC UI station table parser compared with the BeautifulSoup parser it replaced."""
+import re
+
+import pytest
+
+BeautifulSoup = pytest.importorskip("bs4").BeautifulSoup
+
+from benchmarks.fake_router import FakeRouter, SESSION_ID  # noqa: E402
+from custom_components.iptime_tracker.backends.pc import (  # noqa: E402
+    parse_pcinfo_page,
+    parse_pcinfo_status,
+)
+
+HEADER = '<tr class="item_text"><td>MAC 주소</td><td></td><td>연결 시간</td><td>IP 주소</td><td></td></tr>'
+
+
+def device_parsing(text, band):
+    """device_parsing and the BeautifulSoup call of wlan_check before the dedicated parser."""
+    response_list = BeautifulSoup(text, "html.parser").find_all("tr")
+    result_dict = {}
+    if len(response_list) == 0:
+        raise KeyError()
+
+    for device in response_list:
+        if len(device.find_all("td")) == 4:
+            gray_text = device.find_all("td")[3]
+            if len(gray_text):
+                ip = re.search(
+                    re.compile(r"\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}"), gray_text.text
+                ).group()
+            else:
+                ip = "N/A"
+            result_dict[device.find_all("td")[0].text] = {
+                "ip": ip,
+                "band": band,
+                "stay_time": device.find_all("td")[2].text,
+                "state": "home",
+            }
+        else:
+            result_dict["session"] = True
+    return result_dict
+
+
+def as_table(result_dict):
+    return {
+        key: value if key == "session" else {
+            "ip": value.ip,
+            "band": value.band,
+            "stay_time": value.stay_time,
+            "state": value.state,
+        }
+        for key, value in result_dict.items()
+    }
+
+
+def page(*rows):
+    return "<html><body><table>" + "\n".join(rows) + "</table></body></html>"
+
+
+def row(mac, stay, ip_cell):
+    return (
+        '<tr class="item_text">'
+        f'<td class="mac">{mac}</td>'
+        '<td><input type="checkbox" name="pcinfo"></td>'
+        f"<td>{stay}</td>"
+        f'<td class="gray_text">{ip_cell}</td>'
+        "</tr>"
+    )
+
+
+def fake_router_page(stations):
+    router = FakeRouter("pc", stations=stations)
+    return router._pc_wlan({"cookies": {"efm_session_id": SESSION_ID}}, "5GHz")[2].decode()
+
+
+PAGES = {
+    "fake_router": fake_router_page(20),
+    "header_only": page(HEADER),
+    "empty_ip_cell": page(HEADER, row("02-00-00-00-00-01", "0일 0시간 1분 2초", "")),
+    "plain_ip_cell": page(HEADER, row("02-00-00-00-00-02", "1일 2시간 3분 4초", "192.168.0.10")),
+    "nested_markup": page(
+        HEADER,
+        row(
+            "02-00-00-00-00-03",
+            "<span>2일</span> 0시간 0분 5초",
+            "<span><!-- dhcp --><b>10.0.0.7</b></span>",
+        ),
+    ),
+    "entities": page(HEADER, row("02-00-00-00-00-04", "0일&nbsp;5시간 0분 0초", "<span>192.168.0.11</span>")),
+    "uppercase_tags": (
+        "<HTML><TABLE>"
+        '<TR><TD>MAC</TD><TD></TD><TD>TIME</TD><TD>IP</TD><TD></TD></TR>'
+        '<TR class="item_text"><TD>02-00-00-00-00-05</TD><TD></TD><TD>0일 0시간 0분 9초</TD>'
+        "<TD><SPAN>192.168.0.12</SPAN></TD></TR>"
+        "</TABLE></HTML>"
+    ),
+    "line_breaks": page(
+        HEADER,
+        '<tr class="item_text">\n'
+        '  <td class="mac">02-00-00-00-00-06</td>\n'
+        '  <td><input type="checkbox"></td>\n'
+        "  <td>0일 1시간 0분 0초</td>\n"
+        '  <td class="gray_text"><span>192.168.0.13</span></td>\n'
+        "</tr>",
+    ),
+}
+
+
+@pytest.mark.parametrize("name", sorted(PAGES))
+def test_same_table_as_beautifulsoup(name):
+    text = PAGES[name]
+    assert as_table(parse_pcinfo_status(text, "5GHz")) == device_parsing(text, "5GHz")
+
+
+@pytest.mark.parametrize("text", ["", '<html><script>parent.parent.location = "/sess-bin/login_session.cgi?noauto=1"; //session_timeout </script></html>'])
+def test_page_without_rows_raises_key_error(text):
+    with pytest.raises(KeyError):
+        device_parsing(text, "5GHz")
+    with pytest.raises(KeyError):
+        parse_pcinfo_status(text, "5GHz")
+
+
+def test_ip_cell_without_address_is_na():
+    text = page(HEADER, row("02-00-00-00-00-07", "0일 0시간 0분 1초", "<span>-</span>"))
+    with pytest.raises(AttributeError):
+        device_parsing(text, "2.4GHz")
+    result = parse_pcinfo_status(text, "2.4GHz")
+    assert result["session"] is True
+    assert result["02-00-00-00-00-07"].ip == "N/A"
+
+
+def test_unchanged_page_reuses_stations_with_new_connection_time():
+    first = fake_router_page(10).encode()
+    router = FakeRouter("pc", stations=10)
+    request = {"cookies": {"efm_session_id": SESSION_ID}}
+    router._pc_wlan(request, "5GHz")
+    second = router._pc_wlan(request, "5GHz")[2]
+    assert first != second
+
+    result, entry = parse_pcinfo_page(first, "utf-8", "5GHz")
+    assert entry is not None
+    cached, cached_entry = parse_pcinfo_page(second, "utf-8", "5GHz", entry)
+    assert cached_entry is entry
+    assert as_table(cached) == as_table(parse_pcinfo_page(second, "utf-8", "5GHz")[0])
+
+
+def test_changed_station_set_is_parsed_again():
+    first = page(HEADER, row("02-00-00-00-00-08", "0일 0시간 0분 1초", "<span>192.168.0.14</span>"))
+    second = page(HEADER, row("02-00-00-00-00-09", "0일 0시간 0분 2초", "<span>192.168.0.14</span>"))
+    _, entry = parse_pcinfo_page(first.encode(), "utf-8", "5GHz")
+    result, new_entry = parse_pcinfo_page(second.encode(), "utf-8", "5GHz", entry)
+    assert new_entry is not entry
+    assert list(result) == ["session", "02-00-00-00-00-09"]
@@ -0,0 +1,168 @@
+"""Polls against the fake router with a failing source."""
+import asyncio
+import json
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from benchmarks.fake_router import FakeRouter, SESSION_ID  # noqa: E402
+from custom_components.iptime_tracker import device_tracker  # noqa: E402
+from custom_components.iptime_tracker.const import BETA_SERVICE_URN, MESH_STATION_URN, WLAN_5G_URN  # noqa: E402
+from custom_components.iptime_tracker.coordinator import IPTimeCoordinator  # noqa: E402
+from custom_components.iptime_tracker.scheduler import AdaptiveInterval  # noqa: E402
+from custom_components.iptime_tracker.station import Station  # noqa: E402
+
+
+def run(router, scenario):
+    """Start the fake router and run scenario(router, api) after the first poll."""
+
+    async def main():
+        url = await router.start()
+        api = device_tracker.IPTimeAPI(None, url, "admin", "admin")
+        try:
+            assert await api.async_update()
+            return await scenario(router, api)
+        finally:
+            await api.async_close()
+            await router.stop()
+
+    return asyncio.run(main())
+
+
+def stations(result):
+    return {key for key, value in result.items() if isinstance(value, Station)}
+
+
+@pytest.mark.parametrize("flavor", ["pc", "mobile", "beta_ui"])
+def test_mesh_timeout_keeps_session_and_band_results(flavor, monkeypatch):
+    monkeypatch.setattr(device_tracker, "TIME_OUT", 0.2)
+
+    async def scenario(router, api):
+        await api.async_update()
+        assert api.result["sources"]["mesh"] is True
+        router.delays[("GET", MESH_STATION_URN)] = 0.4
+        await api.async_update()
+        await asyncio.sleep(0.3)
+        # MESH 목록의 시간 초과는 세션 끊김이 아니므로 로그아웃하지 않고, 응답한 목록은 사용합니다.
+        assert api.result["session"] is True
+        assert api.result["sources"]["mesh"] is False
+        assert all(api.result["sources"][source] for source in api.result["sources"] if source != "mesh")
+        assert stations(api.result)
+        assert api.efm_session_id == SESSION_ID
+        assert api._ismesh
+
+    run(FakeRouter(flavor, stations=9, mesh=True), scenario)
+
+
+@pytest.mark.parametrize("flavor", ["pc", "mobile"])
+def test_unreadable_mesh_body_with_live_bands_is_not_a_session_loss(flavor):
+    async def scenario(router, api):
+        await api.async_update()
+        # 과부하 상태의 공유기처럼 MESH 목록 대신 다른 페이지를 돌려줍니다.
+        router._routes[("GET", MESH_STATION_URN)] = lambda request: (503, "text/html", b"<html>busy</html>", "")
+        await api.async_update()
+        assert api.result["session"] is True
+        assert api.result["sources"]["mesh"] is False
+        assert api.efm_session_id == SESSION_ID
+
+    run(FakeRouter(flavor, stations=9, mesh=True), scenario)
+
+
+@pytest.mark.parametrize("flavor", ["pc", "mobile"])
+def test_expired_session_logs_out(flavor, monkeypatch):
+    async def scenario(router, api):
+        await api.async_update()
+        # 공유기가 세션을 만료시키면 모든 목록이 로그인 페이지로 바뀝니다.
+        monkeypatch.setattr(router, "_authorized", lambda request: False)
+        await api.async_update()
+        assert api.result["session"] is False
+        assert api.efm_session_id is None
+
+    run(FakeRouter(flavor, stations=9, mesh=True), scenario)
+
+
+def test_beta_batch_without_ids_is_matched_by_position(monkeypatch):
+    router = FakeRouter("beta_ui", stations=9)
+    beta_call = router._beta_call
+
+    def call_without_id(call, request):
+        response, extra = beta_call(call, request)
+        response.pop("id", None)
+        return response, extra
+
+    monkeypatch.setattr(router, "_beta_call", call_without_id)
+
+    async def scenario(router, api):
+        await api.async_update()
+        assert api.result["session"] is True
+        assert len(stations(api.result)) == 9
+        assert api._beta_batch is not True
+
+    run(router, scenario)
+
+
+def test_unmatched_beta_batch_falls_back_to_single_calls(monkeypatch):
+    router = FakeRouter("beta_ui", stations=9)
+    beta_service = router._beta_service
+
+    def short_batch(request):
+        status, content_type, payload, extra = beta_service(request)
+        document = json.loads(payload)
+        if isinstance(document, list):
+            payload = json.dumps(document[:1]).encode()
+        return status, content_type, payload, extra
+
+    async def scenario(router, api):
+        await api.async_update()
+        assert api._beta_batch is True
+        # 펌웨어가 batch 응답의 일부만 돌려주기 시작합니다.
+        router._routes[("POST", BETA_SERVICE_URN)] = short_batch
+        await api.async_update()
+        assert api._beta_batch is False
+        await api.async_update()
+        assert len(stations(api.result)) == 9
+
+    run(router, scenario)
+
+
+def test_failing_band_does_not_hold_the_minimum_interval(monkeypatch):
+    monkeypatch.setattr(device_tracker, "TIME_OUT", 0.2)
+    router = FakeRouter("pc", stations=4)
+
+    async def async_see(**kwargs):
+        pass
+
+    async def scenario(router, api):
+        api.ready = True
+        sensor = device_tracker.IPTimeSensor("phone", router.stations[0]["mac"], api)
+        adaptive = AdaptiveInterval(timedelta(seconds=10), timedelta(seconds=2), timedelta(seconds=60))
+        coordinator = IPTimeCoordinator(api, [sensor], async_see, adaptive=adaptive)
+        await coordinator.async_poll()
+        assert sensor.state == "home"
+        # 단말이 연결된 5GHz 목록이 계속 응답하지 않습니다.
+        router.delays[("GET", WLAN_5G_URN)] = 0.4
+        intervals = [await coordinator.async_poll() for _ in range(8)]
+        assert sensor.state == "N/A"
+        assert intervals[-1] > timedelta(seconds=10)
+
+    run(router, scenario)
+
+
+def test_departure_polls_at_the_minimum_interval():
+    router = FakeRouter("pc", stations=4)
+
+    async def async_see(**kwargs):
+        pass
+
+    async def scenario(router, api):
+        api.ready = True
+        sensor = device_tracker.IPTimeSensor("phone", router.stations[0]["mac"], api)
+        adaptive = AdaptiveInterval(timedelta(seconds=10), timedelta(seconds=2), timedelta(seconds=60))
+        coordinator = IPTimeCoordinator(api, [sensor], async_see, adaptive=adaptive)
+        await coordinator.async_poll()
+        del router.stations[0]
+        assert await coordinator.async_poll() == timedelta(seconds=2)
+
+    run(router, scenario)
@@ -0,0 +1,35 @@
+"""RSSI smoothing across polls with missing lists."""
+from custom_components.iptime_tracker.const import RSS_ALPHA
+from custom_components.iptime_tracker.rssi import IPTimeSignalFilter
+from custom_components.iptime_tracker.station import Station
+
+MAC = "02-00-00-00-00-01"
+
+
+def poll(signal, rssi=None, responded=True):
+    stations = {MAC: Station("192.168.0.10", "5GHz", 10, rssi, source="mesh")} if rssi is not None else {}
+    signal.apply(stations, {"beta_stations": True, "mesh": responded})
+    return signal.smoothed(MAC)
+
+
+def test_missing_list_keeps_the_ewma():
+    signal = IPTimeSignalFilter()
+    assert poll(signal, -60) == -60
+    poll(signal, responded=False)
+    poll(signal, responded=False)
+    assert poll(signal, -80) == round(-60 + RSS_ALPHA * (-80 + 60), 1)
+
+
+def test_station_gone_from_a_responding_list_starts_again():
+    signal = IPTimeSignalFilter()
+    poll(signal, -60)
+    assert poll(signal) is None
+    assert poll(signal, -80) == -80
+
+
+def test_station_without_sources_information():
+    signal = IPTimeSignalFilter()
+    signal.apply({MAC: Station("192.168.0.10", "5GHz", 10, -60, source="mesh")})
+    signal.apply({})
+    signal.apply({MAC: Station("192.168.0.10", "5GHz", 10, -70, source="mesh")})
+    assert signal.smoothed(MAC) == -70
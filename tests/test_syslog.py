@@ -0,0 +1,46 @@
+"""Syslog lines that report, or only mention, a wireless station."""
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.iptime_tracker.syslog import parse_station_event  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "line, event",
+    [
+        ("hostapd: wlan0: AP-STA-CONNECTED aa:bb:cc:dd:ee:01", ("aa:bb:cc:dd:ee:01", True)),
+        ("hostapd: wlan1: AP-STA-DISCONNECTED aa:bb:cc:dd:ee:02", ("aa:bb:cc:dd:ee:02", False)),
+        ("wlan0: STA aa:bb:cc:dd:ee:03 IEEE 802.11: associated (aid 1)", ("aa:bb:cc:dd:ee:03", True)),
+        ("wlan0: STA aa:bb:cc:dd:ee:04 IEEE 802.11: reassociated", ("aa:bb:cc:dd:ee:04", True)),
+        ("wlan0: STA aa:bb:cc:dd:ee:05 IEEE 802.11: disassociated", ("aa:bb:cc:dd:ee:05", False)),
+        ("wlan0: STA aa:bb:cc:dd:ee:06 IEEE 802.11: deauthenticated due to inactivity", ("aa:bb:cc:dd:ee:06", False)),
+        ("[5G] 무선 연결 : AA-BB-CC-DD-EE-07", ("AA-BB-CC-DD-EE-07", True)),
+        ("[2.4G] 무선 단말 연결 해제 : AA-BB-CC-DD-EE-08", ("AA-BB-CC-DD-EE-08", False)),
+        ("AA-BB-CC-DD-EE-09 무선 접속 끊김", ("AA-BB-CC-DD-EE-09", False)),
+    ],
+)
+def test_association_messages(line, event):
+    assert parse_station_event(line.encode("utf-8")) == event
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "udhcpd: sending ACK to 192.168.0.10 (AA-BB-CC-DD-EE-10) connected",
+        "DHCP 서버: AA-BB-CC-DD-EE-11 에 192.168.0.11 할당 (연결)",
+        "관리자 접속 : 192.168.0.2 (AA-BB-CC-DD-EE-12)",
+        "admin login from 192.168.0.2 aa:bb:cc:dd:ee:13 authorized",
+        "wlan0: STA aa:bb:cc:dd:ee:14 WPA: pairwise key handshake completed",
+        "무선 연결 설정이 변경되었습니다",
+    ],
+)
+def test_other_lines_with_mac_are_ignored(line):
+    assert parse_station_event(line.encode("utf-8")) is None
+
+
+def test_euc_kr_line():
+    assert parse_station_event("[5G] 무선 연결 해제 : AA-BB-CC-DD-EE-15".encode("euc-kr")) == (
+        "AA-BB-CC-DD-EE-15",
+        False,
+    )
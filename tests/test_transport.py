@@ -0,0 +1,305 @@
+"""Tests for the pooled HTTP/1.1 transport against a scripted local server."""
+import asyncio
+import gzip
+import ssl
+import zlib
+
+import pytest
+
+from custom_components.iptime_tracker.transport import IPTimeTransport, TransportError
+
+CLOSE = "close"
+
+
+class ScriptedServer:
+    """HTTP server answering every request with respond(request).
+
+    respond returns the raw response bytes, (CLOSE, bytes) to close the
+    connection after answering, or None to close it without answering.
+    Every request is recorded with the index of the connection it arrived on.
+    """
+
+    def __init__(self, respond):
+        self._respond = respond
+        self.requests = []
+        self.connections = 0
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        connection = self.connections
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                request = {
+                    "method": method,
+                    "target": target,
+                    "headers": headers,
+                    "body": body,
+                    "connection": connection,
+                }
+                self.requests.append(request)
+                payload = self._respond(request)
+                if payload is None:
+                    break
+                close = isinstance(payload, tuple)
+                if close:
+                    payload = payload[1]
+                writer.write(payload)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def response(body=b"", status="200 OK", headers=()):
+    head = [f"HTTP/1.1 {status}", f"Content-Length: {len(body)}", *headers]
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+def run(respond, scenario):
+    """Start a ScriptedServer and run scenario(server, transport)."""
+
+    async def main():
+        server = ScriptedServer(respond)
+        url = await server.start()
+        transport = IPTimeTransport(url)
+        try:
+            return await scenario(server, transport)
+        finally:
+            await transport.close()
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_content_length_body_and_keep_alive():
+    async def scenario(server, transport):
+        first = await transport.get(server.url + "/a", timeout=5)
+        second = await transport.get(server.url + "/b", timeout=5)
+        assert (first.status_code, first.content) == (200, b"ok")
+        assert second.content == b"ok"
+        assert server.connections == 1
+
+    run(lambda request: response(b"ok"), scenario)
+
+
+def test_chunked_body_with_extension_and_trailer():
+    payload = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Transfer-Encoding: chunked\r\n"
+        b"\r\n"
+        b"5;name=value\r\nhello\r\n"
+        b"7\r\n, world\r\n"
+        b"0\r\n"
+        b"X-Trailer: 1\r\n"
+        b"\r\n"
+    )
+
+    async def scenario(server, transport):
+        first = await transport.get(server.url + "/", timeout=5)
+        second = await transport.get(server.url + "/", timeout=5)
+        assert first.content == b"hello, world"
+        assert second.content == b"hello, world"
+        # 마지막 chunk와 trailer까지 읽었으므로 같은 연결을 재사용합니다.
+        assert server.connections == 1
+
+    run(lambda request: payload, scenario)
+
+
+def test_chunked_body_cut_off_raises():
+    payload = b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nhel"
+
+    async def scenario(server, transport):
+        # 서버가 연결을 끊지 않으므로 응답 도중 멈춘 본문은 시간 초과로 끝납니다.
+        with pytest.raises((asyncio.TimeoutError, asyncio.IncompleteReadError, TransportError)):
+            await transport.get(server.url + "/", timeout=0.5)
+
+    run(lambda request: payload, scenario)
+
+
+@pytest.mark.parametrize(
+    "encoding, compress",
+    [
+        ("gzip", gzip.compress),
+        ("deflate", zlib.compress),
+        ("deflate", lambda data: zlib.compress(data)[2:-4]),
+    ],
+)
+def test_compressed_body(encoding, compress):
+    body = compress("단말 목록".encode("utf-8") * 10)
+
+    async def scenario(server, transport):
+        result = await transport.get(server.url + "/", timeout=5)
+        assert result.content == "단말 목록".encode("utf-8") * 10
+
+    run(lambda request: response(body, headers=[f"Content-Encoding: {encoding}"]), scenario)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+def test_corrupt_compressed_body_raises(encoding):
+    async def scenario(server, transport):
+        with pytest.raises(TransportError):
+            await transport.get(server.url + "/", timeout=5)
+
+    run(lambda request: response(b"not compressed", headers=[f"Content-Encoding: {encoding}"]), scenario)
+
+
+def test_https_context_skips_certificate_loading():
+    context = IPTimeTransport("https://192.168.0.1")._ssl
+    assert context.verify_mode == ssl.CERT_NONE
+    assert not context.check_hostname
+    assert context.cert_store_stats()["x509_ca"] == 0
+
+
+def test_body_until_close_without_length():
+    def respond(request):
+        return CLOSE, b"HTTP/1.0 200 OK\r\nContent-Type: text/html\r\n\r\n<html></html>"
+
+    async def scenario(server, transport):
+        result = await transport.get(server.url + "/", timeout=5)
+        # 본문 길이가 없으면 연결이 닫힐 때까지 읽고, 그 연결은 재사용하지 않습니다.
+        assert result.content == b"<html></html>"
+        assert transport._idle == []
+
+    run(respond, scenario)
+
+
+def test_tolerates_broken_header_lines():
+    payload = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"X-Frame-Options SAMEORIGIN\r\n"
+        b"Set-Cookie: efm_session_id=A1B2C3D4E5F6A7B8; Path=/\r\n"
+        b"Content-Type: text/html; charset=euc-kr\r\n"
+        b"Content-Length: 4\r\n"
+        b"\r\n"
+        b"\xc7\xd1\xb1\xdb"
+    )
+
+    async def scenario(server, transport):
+        result = await transport.get(server.url + "/", timeout=5)
+        assert result.cookies == {"efm_session_id": "A1B2C3D4E5F6A7B8"}
+        assert result.encoding == "euc-kr"
+        assert result.text == "한글"
+
+    run(lambda request: payload, scenario)
+
+
+def test_get_retried_on_fresh_connection_after_dead_keep_alive():
+    def respond(request):
+        if request["connection"] == 0 and len(request["target"]) > 2:
+            # 유휴 연결을 정리한 공유기처럼, 두 번째 요청에 응답하지 않고 연결을 닫습니다.
+            return None
+        return response(b"ok")
+
+    async def scenario(server, transport):
+        await transport.get(server.url + "/", timeout=5)
+        result = await transport.get(server.url + "/second", timeout=5)
+        assert result.content == b"ok"
+        assert [request["connection"] for request in server.requests] == [0, 0, 1]
+
+    run(respond, scenario)
+
+
+def test_post_not_retried_after_dead_keep_alive():
+    def respond(request):
+        if request["method"] == "POST":
+            return None
+        return response(b"ok")
+
+    async def scenario(server, transport):
+        await transport.get(server.url + "/", timeout=5)
+        with pytest.raises(TransportError):
+            await transport.post(server.url + "/login", data={"username": "admin"}, timeout=5)
+        # 공유기가 이미 처리했을 수 있으므로 POST는 한 번만 보냅니다.
+        assert [request["method"] for request in server.requests] == ["GET", "POST"]
+
+    run(respond, scenario)
+
+
+def test_pooled_connection_closed_by_router_is_not_used():
+    async def scenario(server, transport):
+        # keep-alive 응답을 보낸 뒤 공유기가 유휴 연결을 닫습니다.
+        await transport.get(server.url + "/", timeout=5)
+        await asyncio.sleep(0.1)
+        result = await transport.post(server.url + "/login", data={"a": "b"}, timeout=5)
+        # 닫힌 유휴 연결을 쓰지 않으므로 POST도 새 연결로 한 번에 성공합니다.
+        assert result.content == b"ok"
+        assert [request["connection"] for request in server.requests] == [0, 1]
+
+    run(lambda request: (CLOSE, response(b"ok")), scenario)
+
+
+def test_redirect_on_same_router_is_followed():
+    def respond(request):
+        if request["target"] == "/login":
+            return response(status="302 Found", headers=["Location: /home"])
+        return response(request["method"].encode() + b" " + request["body"])
+
+    async def scenario(server, transport):
+        result = await transport.post(server.url + "/login", data={"a": "b"}, timeout=5)
+        # 302는 본문 없이 GET으로 따라갑니다.
+        assert result.content == b"GET "
+        assert result.url == server.url + "/home"
+        assert [request["target"] for request in server.requests] == ["/login", "/home"]
+
+    run(respond, scenario)
+
+
+def test_temporary_redirect_keeps_method_and_body():
+    def respond(request):
+        if request["target"] == "/old":
+            return response(status="307 Temporary Redirect", headers=["Location: /new"])
+        return response(request["method"].encode() + b" " + request["body"])
+
+    async def scenario(server, transport):
+        result = await transport.post(server.url + "/old", data="x=1", timeout=5)
+        assert result.content == b"POST x=1"
+
+    run(respond, scenario)
+
+
+def test_redirect_to_other_host_is_returned():
+    def respond(request):
+        return response(status="302 Found", headers=["Location: http://example.invalid/"])
+
+    async def scenario(server, transport):
+        result = await transport.get(server.url + "/", timeout=5)
+        assert result.status_code == 302
+        assert len(server.requests) == 1
+
+    run(respond, scenario)
+
+
+def test_closed_transport_refuses_requests():
+    async def scenario(server, transport):
+        await transport.close()
+        with pytest.raises(TransportError):
+            await transport.get(server.url + "/", timeout=5)
+        assert server.requests == []
+
+    run(lambda request: response(b"ok"), scenario)